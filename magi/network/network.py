@@ -40,6 +40,10 @@ class ConnectionStatus(Enum):
     HOSTILE = "hostile"  # Connection is compromised or attacking
 
 
+# Statuses that can receive broadcast traffic
+_REACHABLE_STATUSES = frozenset((ConnectionStatus.CONNECTED, ConnectionStatus.AUTHENTICATED))
+
+
 class ThreatLevel(Enum):
     """Threat level assessment for network activity."""
     NONE = "none"
@@ -258,15 +262,16 @@ class MAGINetwork:
     
     def broadcast(self, message_type: str, payload: Dict[str, Any]) -> List[str]:
         """Broadcast a message to all connected nodes."""
-        recipients = []
+        recipients: List[str] = []
+        messages: List[NetworkMessage] = []
+        blocked = self.intrusion_detector.blocked_nodes
         
         for node_id, node in self.nodes.items():
-            if node.status in [ConnectionStatus.CONNECTED, ConnectionStatus.AUTHENTICATED]:
-                if node_id not in self.intrusion_detector.blocked_nodes:
-                    message = self._create_message(node_id, message_type, payload)
-                    self.message_log.append(message)
-                    recipients.append(node_id)
+            if node.status in _REACHABLE_STATUSES and node_id not in blocked:
+                messages.append(self._create_message(node_id, message_type, payload))
+                recipients.append(node_id)
         
+        self.message_log.extend(messages)
         return recipients
     
     def send(self, target_node: str, message_type: str, payload: Dict[str, Any]) -> bool:
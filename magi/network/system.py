@@ -324,11 +324,15 @@ class MAGISystem:
     def _analyze_verdicts(self, verdicts: Dict[str, Dict], require_unanimous: bool) -> Dict[str, Any]:
         """Analyze verdicts and determine consensus."""
         
-        # Count verdict types
+        # Count verdict types and collect conditions in a single pass
         counts = {"APPROVE": 0, "REJECT": 0, "CONDITIONAL": 0, "ERROR": 0}
+        all_conditions = []
         for v in verdicts.values():
             verdict_type = v.get("verdict", "ERROR")
             counts[verdict_type] = counts.get(verdict_type, 0) + 1
+            conditions = v.get("conditions")
+            if conditions:
+                all_conditions.extend(conditions)
         
         # Determine consensus
         if counts["ERROR"] > 0:
@@ -353,12 +357,12 @@ class MAGISystem:
             consensus = "DEADLOCK"
             final_verdict = None
         
-        # Collect conditions
-        all_conditions = []
-        for v in verdicts.values():
-            conditions = v.get("conditions", [])
-            if conditions:
-                all_conditions.extend(conditions)
+        # Dissent depends on the final verdict, so it needs its own pass
+        dissenting_units = []
+        if final_verdict:
+            for v in verdicts.values():
+                if v.get("verdict") != final_verdict:
+                    dissenting_units.append(v["designation"])
         
         # Build result
         return {
@@ -368,10 +372,7 @@ class MAGISystem:
             "verdicts": verdicts,
             "vote_counts": counts,
             "conditions": list(set(all_conditions)),
-            "dissenting_units": [
-                v["designation"] for v in verdicts.values()
-                if v.get("verdict") != final_verdict and final_verdict
-            ],
+            "dissenting_units": dissenting_units,
         }
     
     def query_unit(self, unit_name: str, query: str) -> Dict[str, Any]:
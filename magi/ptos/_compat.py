@@ -0,0 +1,9 @@
+"""
+Interpreter compatibility shims shared by the PTOS modules.
+"""
+
+import sys
+
+
+# Slotted dataclasses (no per-instance __dict__) where the interpreter supports them
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
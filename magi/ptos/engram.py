@@ -16,11 +16,18 @@ The engram system allows MAGI units to learn from experience and develop
 beyond their initial personality transplant.
 """
 
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Set
+from functools import partial
+from typing import DefaultDict, Dict, List, Optional, Any, Set, Tuple
 from enum import Enum
 from datetime import datetime
 import hashlib
+import time
+
+from ._compat import SLOTS
 
 
 class EngramType(Enum):
@@ -32,6 +39,13 @@ class EngramType(Enum):
     PROSPECTIVE = "prospective" # Future intentions and plans
 
 
+# Minimum link strength followed by associative retrieval
+_STRONG_LINK = 0.3
+
+# Retrievals beyond which an engram is consolidated (the "hot" tier)
+_REHEARSAL_THRESHOLD = 3
+
+
 class EngramStrength(Enum):
     """Strength/durability of an engram."""
     TRANSIENT = "transient"     # Short-term, will decay
@@ -40,7 +54,7 @@ class EngramStrength(Enum):
     PERMANENT = "permanent"     # Core memories, will not decay
 
 
-@dataclass
+@dataclass(**SLOTS)
 class EngramLink:
     """Association between two engrams."""
     target_id: str
@@ -49,7 +63,7 @@ class EngramLink:
     bidirectional: bool = False
 
 
-@dataclass
+@dataclass(**SLOTS)
 class MemoryEngram:
     """
     A single memory unit within the MAGI's organic substrate.
@@ -74,7 +88,7 @@ class MemoryEngram:
     
     # Temporal properties
     formation_time: datetime = field(default_factory=datetime.now)
-    last_retrieval: Optional[datetime] = None
+    last_retrieval: Optional[int] = None  # time.time_ns() of last retrieval
     retrieval_count: int = 0
     
     # Consolidation
@@ -92,10 +106,21 @@ class MemoryEngram:
     source: str = ""  # Where this memory came from
     reliability: float = 1.0  # How reliable/accurate this memory is
     
+    # Cached targets of links at the default strength cutoff
+    _strong_links: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # Store this engram was last stored in, told about new links so its
+    # link graph and link count stay current
+    _store: Optional["EngramStore"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def retrieve(self) -> str:
         """Retrieve this engram's content, updating access metadata."""
         self.retrieval_count += 1
-        self.last_retrieval = datetime.now()
+        self.last_retrieval = time.time_ns()
         
         # Strengthen through retrieval
         if self.strength == EngramStrength.TRANSIENT:
@@ -103,6 +128,13 @@ class MemoryEngram:
         
         return self.content
     
+    @property
+    def last_retrieval_time(self) -> Optional[datetime]:
+        """Wall-clock time of the last retrieval, if any."""
+        if self.last_retrieval is None:
+            return None
+        return datetime.fromtimestamp(self.last_retrieval / 1e9)
+    
     def activate(self, amount: float) -> bool:
         """
         Activate this engram. Returns True if activation exceeds threshold.
@@ -112,7 +144,8 @@ class MemoryEngram:
     
     def decay(self, amount: float = 0.01) -> None:
         """Apply decay to activation level."""
-        self.current_activation = max(0.0, self.current_activation - amount)
+        activation = self.current_activation - amount
+        self.current_activation = activation if activation > 0.0 else 0.0
     
     def consolidate(self) -> None:
         """Strengthen this engram through consolidation."""
@@ -132,10 +165,24 @@ class MemoryEngram:
             strength=strength,
             link_type=link_type
         ))
+        self._strong_links = None
+        if self._store is not None:
+            self._store._link_added()
     
-    def get_linked_ids(self, min_strength: float = 0.3) -> List[str]:
-        """Get IDs of linked engrams above minimum strength."""
-        return [link.target_id for link in self.links if link.strength >= min_strength]
+    def get_linked_ids(self, min_strength: float = _STRONG_LINK) -> List[str]:
+        """
+        Get IDs of linked engrams above minimum strength.
+        
+        The targets for the default cutoff are cached until add_link is
+        called; each caller gets its own copy.
+        """
+        if min_strength != _STRONG_LINK:
+            return [link.target_id for link in self.links if link.strength >= min_strength]
+        if self._strong_links is None:
+            self._strong_links = [
+                link.target_id for link in self.links if link.strength >= _STRONG_LINK
+            ]
+        return list(self._strong_links)
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize engram to dictionary."""
@@ -148,9 +195,87 @@ class MemoryEngram:
             "emotional_valence": self.emotional_valence,
             "consolidation_level": self.consolidation_level,
             "retrieval_count": self.retrieval_count,
+            "last_retrieval": (
+                self.last_retrieval_time.isoformat() if self.last_retrieval is not None else None
+            ),
         }
 
 
+# CSR adjacency: (indptr, indices, weights)
+CSRGraph = Tuple[array, array, array]
+
+# Frontier/unvisited ratio above which expansion switches to bottom-up
+_BOTTOM_UP_RATIO = 0.1
+
+
+def _spread(
+    forward: CSRGraph,
+    reverse: CSRGraph,
+    seeds: List[int],
+    depth: int,
+    decay: float,
+    threshold: float
+) -> Dict[int, float]:
+    """
+    Breadth-first spreading activation over a CSR link graph.
+    
+    Works purely on integer node indices and flat arrays, without touching
+    engram objects. Small frontiers are expanded top-down along outgoing
+    links; once the frontier is large relative to the unvisited nodes, the
+    remaining nodes instead check their incoming links (bottom-up), which
+    avoids revisiting neighbours that are already activated.
+    
+    Returns the activation reached by each visited node.
+    """
+    indptr, indices, weights = forward
+    rev_indptr, rev_indices, rev_weights = reverse
+    num_nodes = len(indptr) - 1
+    
+    # Nodes are marked visited when first discovered, so each is queued once
+    visited = bytearray(num_nodes)
+    frontier = []
+    for node in seeds:
+        if not visited[node]:
+            visited[node] = 1
+            frontier.append(node)
+    visited_count = len(frontier)
+    
+    activation: Dict[int, float] = {}
+    current = 1.0
+    
+    for _ in range(depth):
+        for node in frontier:
+            activation[node] = current
+        
+        next_frontier = []
+        if len(frontier) > _BOTTOM_UP_RATIO * (num_nodes - visited_count):
+            in_frontier = bytearray(num_nodes)
+            for node in frontier:
+                in_frontier[node] = 1
+            for node in range(num_nodes):
+                if visited[node]:
+                    continue
+                for edge in range(rev_indptr[node], rev_indptr[node + 1]):
+                    if rev_weights[edge] >= threshold and in_frontier[rev_indices[edge]]:
+                        visited[node] = 1
+                        next_frontier.append(node)
+                        break
+        else:
+            for node in frontier:
+                for edge in range(indptr[node], indptr[node + 1]):
+                    if weights[edge] >= threshold:
+                        target = indices[edge]
+                        if not visited[target]:
+                            visited[target] = 1
+                            next_frontier.append(target)
+        
+        visited_count += len(next_frontier)
+        frontier = next_frontier
+        current *= decay
+    
+    return activation
+
+
 class EngramStore:
     """
     Storage and retrieval system for memory engrams.
@@ -161,43 +286,171 @@ class EngramStore:
     def __init__(self, designation: str):
         self.designation = designation
         self.engrams: Dict[str, MemoryEngram] = {}
-        self._keyword_index: Dict[str, Set[str]] = {}
+        
+        # Engram ids are numbered on first store; keyword postings hold those
+        # numbers as sorted compact arrays rather than sets of id strings
+        self._id_to_num: Dict[str, int] = {}
+        self._num_to_id: List[str] = []
+        self._keyword_index: DefaultDict[str, array] = defaultdict(partial(array, "i"))
+        # trigram -> indexed keywords containing it, in indexing order
+        self._trigram_index: DefaultDict[str, Dict[str, None]] = defaultdict(dict)
         self._type_index: Dict[EngramType, Set[str]] = {t: set() for t in EngramType}
+        self._strength_index: Dict[EngramStrength, Set[str]] = {s: set() for s in EngramStrength}
+        self._link_count = 0  # Running total of links across stored engrams
+        self._hot_ids: Set[str] = set()  # Retrieved often enough to consolidate
+        
+        # Link graph in CSR form, rebuilt lazily after stores or new links
+        self._csr_dirty = True
+        self._idx_to_engram: List[MemoryEngram] = []
+        self._id_to_idx: Dict[str, int] = {}
+        self._graph: CSRGraph = (array("l", [0]), array("l"), array("d"))
+        self._reverse_graph: CSRGraph = (array("l", [0]), array("l"), array("d"))
     
     def store(self, engram: MemoryEngram) -> None:
         """Store an engram in the memory system."""
-        self.engrams[engram.engram_id] = engram
+        num = self._register(engram)
         
-        # Update keyword index
+        # Update keyword index (keywords are normalized once, on insert)
         for keyword in engram.keywords:
+            postings = self._keyword_index[keyword.lower()]
+            if not postings:
+                self._index_trigrams(keyword.lower())
+            # New engrams carry the highest number, so this is normally an append
+            pos = bisect_left(postings, num)
+            if pos == len(postings) or postings[pos] != num:
+                postings.insert(pos, num)
+        
+        self._csr_dirty = True
+    
+    def bulk_store(self, engrams: List[MemoryEngram]) -> None:
+        """
+        Store many engrams at once, e.g. when loading a serialized store.
+        
+        Postings are grouped by keyword first so each keyword's index
+        entry is updated once rather than once per engram.
+        """
+        postings: DefaultDict[str, Set[int]] = defaultdict(set)
+        
+        for engram in engrams:
+            num = self._register(engram)
+            for keyword in engram.keywords:
+                postings[keyword.lower()].add(num)
+        
+        for keyword, nums in postings.items():
             if keyword not in self._keyword_index:
-                self._keyword_index[keyword] = set()
-            self._keyword_index[keyword].add(engram.engram_id)
+                self._index_trigrams(keyword)
+            else:
+                nums.update(self._keyword_index[keyword])
+            self._keyword_index[keyword] = array("i", sorted(nums))
+        
+        self._csr_dirty = True
+    
+    def _register(self, engram: MemoryEngram) -> int:
+        """
+        Record an engram in every index but the keyword index.
         
-        # Update type index
-        self._type_index[engram.engram_type].add(engram.engram_id)
+        An engram already stored under the same id is dropped from the
+        type, strength and hot indexes and from the link count first.
+        Returns the engram's posting number.
+        """
+        engram_id = engram.engram_id
+        previous = self.engrams.get(engram_id)
+        if previous is not None:
+            self._type_index[previous.engram_type].discard(engram_id)
+            self._strength_index[previous.strength].discard(engram_id)
+            self._hot_ids.discard(engram_id)
+            self._link_count -= len(previous.links)
+            if previous._store is self:
+                previous._store = None
+        self.engrams[engram_id] = engram
+        engram._store = self
+        
+        self._type_index[engram.engram_type].add(engram_id)
+        self._strength_index[engram.strength].add(engram_id)
+        if engram.retrieval_count > _REHEARSAL_THRESHOLD:
+            self._hot_ids.add(engram_id)
+        self._link_count += len(engram.links)
+        return self._number(engram_id)
+    
+    def _number(self, engram_id: str) -> int:
+        """Get the posting number for an engram id, assigning the next one if new."""
+        num = self._id_to_num.get(engram_id)
+        if num is None:
+            num = self._id_to_num[engram_id] = len(self._num_to_id)
+            self._num_to_id.append(engram_id)
+        return num
+    
+    def _index_trigrams(self, keyword: str) -> None:
+        """Register the trigrams of a newly indexed keyword."""
+        for start in range(len(keyword) - 2):
+            self._trigram_index[keyword[start:start + 3]][keyword] = None
+    
+    def _matching_keywords(self, query: str) -> List[str]:
+        """
+        Indexed keywords containing a lowercase query, in indexing order.
+        
+        Candidates are the keywords under the query's rarest trigram, then
+        checked with a substring test; queries shorter than a trigram fall
+        back to testing every indexed keyword.
+        """
+        if len(query) < 3:
+            return [keyword for keyword in self._keyword_index if query in keyword]
+        
+        postings = [
+            self._trigram_index.get(query[start:start + 3])
+            for start in range(len(query) - 2)
+        ]
+        if not all(postings):
+            return []
+        return [keyword for keyword in min(postings, key=len) if query in keyword]
+    
+    def link(
+        self,
+        source_id: str,
+        target_id: str,
+        strength: float,
+        link_type: str
+    ) -> bool:
+        """Link two stored engrams; the engram reports the new link back to this store."""
+        engram = self.engrams.get(source_id)
+        if not engram:
+            return False
+        engram.add_link(target_id, strength, link_type)
+        return True
+    
+    def _link_added(self) -> None:
+        """Note a link added to one of this store's engrams."""
+        self._link_count += 1
+        self._csr_dirty = True
     
     def retrieve_by_id(self, engram_id: str) -> Optional[MemoryEngram]:
         """Retrieve a specific engram by ID."""
         engram = self.engrams.get(engram_id)
         if engram:
             engram.retrieve()
+            if engram.retrieval_count > _REHEARSAL_THRESHOLD:
+                self._hot_ids.add(engram_id)
         return engram
     
     def search_by_keywords(self, keywords: List[str], top_k: int = 5) -> List[MemoryEngram]:
-        """Search for engrams matching keywords."""
-        candidate_ids: Dict[str, int] = {}
+        """
+        Search for engrams matching keywords.
+        
+        A query keyword matches every indexed keyword it is a substring of
+        (case-insensitively; the empty string matches them all), found
+        through the trigram index rather than a scan of all keywords.
+        """
+        match_counts: Counter = Counter()
         
         for keyword in keywords:
-            keyword_lower = keyword.lower()
-            for idx_keyword, engram_ids in self._keyword_index.items():
-                if keyword_lower in idx_keyword.lower():
-                    for eid in engram_ids:
-                        candidate_ids[eid] = candidate_ids.get(eid, 0) + 1
+            for idx_keyword in self._matching_keywords(keyword.lower()):
+                match_counts.update(self._keyword_index[idx_keyword])
         
-        # Sort by match count and return top k
-        sorted_ids = sorted(candidate_ids.keys(), key=lambda x: candidate_ids[x], reverse=True)
-        return [self.engrams[eid] for eid in sorted_ids[:top_k] if eid in self.engrams]
+        # Top k by match count
+        return [
+            self.engrams[self._num_to_id[num]]
+            for num, _ in match_counts.most_common(top_k)
+        ]
     
     def search_by_type(self, engram_type: EngramType) -> List[MemoryEngram]:
         """Get all engrams of a specific type."""
@@ -213,34 +466,69 @@ class EngramStore:
         Perform spreading activation from seed engrams.
         
         This simulates associative memory retrieval where activating
-        one memory can trigger related memories.
+        one memory can trigger related memories. Traversal runs over the
+        CSR view of the link graph rather than per-engram link lists.
         """
-        activated: Dict[str, float] = {}
-        current_level = seed_ids
-        current_activation = 1.0
-        
-        for _ in range(depth):
-            next_level = []
-            
-            for engram_id in current_level:
-                if engram_id in self.engrams:
-                    engram = self.engrams[engram_id]
-                    engram.activate(current_activation)
-                    activated[engram_id] = max(
-                        activated.get(engram_id, 0), 
-                        current_activation
-                    )
-                    
-                    # Get linked engrams for next level
-                    linked = engram.get_linked_ids()
-                    next_level.extend(linked)
-            
-            current_level = list(set(next_level) - set(activated.keys()))
-            current_activation *= activation_decay
+        if self._csr_dirty:
+            self._rebuild_csr()
+        
+        nodes = self._idx_to_engram
+        seeds = [self._id_to_idx[eid] for eid in seed_ids if eid in self._id_to_idx]
+        activated = _spread(
+            self._graph, self._reverse_graph,
+            seeds, depth, activation_decay, _STRONG_LINK
+        )
+        
+        for idx, level in activated.items():
+            nodes[idx].activate(level)
         
         # Return activated engrams sorted by activation level
-        sorted_ids = sorted(activated.keys(), key=lambda x: activated[x], reverse=True)
-        return [self.engrams[eid] for eid in sorted_ids if eid in self.engrams]
+        sorted_idx = sorted(activated, key=activated.__getitem__, reverse=True)
+        return [nodes[idx] for idx in sorted_idx]
+    
+    def _rebuild_csr(self) -> None:
+        """
+        Rebuild the compressed sparse row views of the link graph.
+        
+        Engrams are numbered in storage order; links to engrams that are
+        not (yet) stored are left out. The reverse graph indexes the same
+        links by target, for bottom-up traversal.
+        """
+        self._idx_to_engram = list(self.engrams.values())
+        self._id_to_idx = {e.engram_id: i for i, e in enumerate(self._idx_to_engram)}
+        
+        indptr = array("l", [0])
+        indices = array("l")
+        weights = array("d")
+        for engram in self._idx_to_engram:
+            for link in engram.links:
+                target = self._id_to_idx.get(link.target_id)
+                if target is not None:
+                    indices.append(target)
+                    weights.append(link.strength)
+            indptr.append(len(indices))
+        
+        # Counting sort of the edges by target
+        num_nodes = len(self._idx_to_engram)
+        rev_indptr = array("l", [0]) * (num_nodes + 1)
+        for target in indices:
+            rev_indptr[target + 1] += 1
+        for node in range(num_nodes):
+            rev_indptr[node + 1] += rev_indptr[node]
+        
+        rev_indices = array("l", [0]) * len(indices)
+        rev_weights = array("d", [0.0]) * len(indices)
+        cursor = rev_indptr[:-1]
+        for source in range(num_nodes):
+            for edge in range(indptr[source], indptr[source + 1]):
+                target = indices[edge]
+                rev_indices[cursor[target]] = source
+                rev_weights[cursor[target]] = weights[edge]
+                cursor[target] += 1
+        
+        self._graph = (indptr, indices, weights)
+        self._reverse_graph = (rev_indptr, rev_indices, rev_weights)
+        self._csr_dirty = False
     
     def emotional_filter(
         self, 
@@ -249,41 +537,66 @@ class EngramStore:
         min_intensity: float = 0.0
     ) -> List[MemoryEngram]:
         """Filter engrams by emotional properties."""
-        result = []
-        
-        for engram in engrams:
-            if engram.emotional_intensity < min_intensity:
-                continue
-            
-            if valence is not None:
-                # Check if valence is in the right direction
-                if valence > 0 and engram.emotional_valence < 0:
-                    continue
-                if valence < 0 and engram.emotional_valence > 0:
-                    continue
-            
-            result.append(engram)
-        
-        return result
+        # The predicate is chosen once per call, leaving one comparison
+        # chain per engram and no per-row valence branching
+        if not valence:
+            return [e for e in engrams if e.emotional_intensity >= min_intensity]
+        if valence > 0:
+            return [
+                e for e in engrams
+                if e.emotional_intensity >= min_intensity and e.emotional_valence >= 0
+            ]
+        return [
+            e for e in engrams
+            if e.emotional_intensity >= min_intensity and e.emotional_valence <= 0
+        ]
     
-    def consolidation_pass(self) -> int:
+    def consolidation_pass(self, scope: str = "all") -> int:
         """
-        Run a consolidation pass on all engrams.
+        Run a consolidation pass over the engram tiers.
         
         This simulates the memory consolidation that happens during
         downtime, strengthening important memories and allowing
         transient ones to decay.
+        
+        The scope selects the tier: "hot" only consolidates frequently
+        retrieved engrams, "cold" only decays transient ones, so each can
+        be scheduled at its own cadence. "all" does both, after rescanning
+        retrieval counts and strengths to pick up engrams retrieved or
+        consolidated outside the store.
+        Returns the number of engrams consolidated.
         """
-        consolidated_count = 0
+        if scope not in ("all", "hot", "cold"):
+            raise ValueError(f"Unknown consolidation scope: {scope}")
         
-        for engram in self.engrams.values():
-            # Consolidate frequently accessed memories
-            if engram.retrieval_count > 3:
+        if scope == "all":
+            self._hot_ids = {
+                eid for eid, e in self.engrams.items()
+                if e.retrieval_count > _REHEARSAL_THRESHOLD
+            }
+            self._strength_index = {s: set() for s in EngramStrength}
+            for eid, engram in self.engrams.items():
+                self._strength_index[engram.strength].add(eid)
+        
+        # Consolidate frequently accessed memories
+        consolidated_count = 0
+        if scope != "cold":
+            for eid in self._hot_ids:
+                engram = self.engrams[eid]
+                previous_strength = engram.strength
                 engram.consolidate()
-                consolidated_count += 1
-            
-            # Decay transient memories
-            elif engram.strength == EngramStrength.TRANSIENT:
+                if engram.strength != previous_strength:
+                    self._strength_index[previous_strength].discard(eid)
+                    self._strength_index[engram.strength].add(eid)
+            consolidated_count = len(self._hot_ids)
+        
+        # Decay transient memories - only the transient bucket is visited,
+        # skipping engrams whose strength changed outside the store since
+        if scope != "hot":
+            for eid in self._strength_index[EngramStrength.TRANSIENT] - self._hot_ids:
+                engram = self.engrams[eid]
+                if engram.strength is not EngramStrength.TRANSIENT:
+                    continue
                 engram.consolidation_level -= 0.05
                 if engram.consolidation_level < -0.5:
                     # Memory fades away (but we keep it for now)
@@ -296,10 +609,7 @@ class EngramStore:
         return {
             "total_engrams": len(self.engrams),
             "by_type": {t.value: len(ids) for t, ids in self._type_index.items()},
-            "by_strength": {
-                s.value: len([e for e in self.engrams.values() if e.strength == s])
-                for s in EngramStrength
-            },
+            "by_strength": {s.value: len(ids) for s, ids in self._strength_index.items()},
             "keywords_indexed": len(self._keyword_index),
-            "avg_links_per_engram": sum(len(e.links) for e in self.engrams.values()) / max(len(self.engrams), 1),
+            "avg_links_per_engram": self._link_count / max(len(self.engrams), 1),
         }
@@ -20,9 +20,10 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 import hashlib
-import json
 from datetime import datetime
 
+from ._compat import SLOTS
+
 
 class PersonalityAspect(Enum):
     """The three fundamental aspects of Dr. Naoko Akagi's personality."""
@@ -39,7 +40,7 @@ class EmotionalValence(Enum):
     AMBIVALENT = "ambivalent"
 
 
-@dataclass
+@dataclass(**SLOTS)
 class PersonalityFragment:
     """
     A discrete fragment of personality - a memory, trait, or pattern
@@ -76,7 +77,7 @@ class PersonalityFragment:
         return base_pattern
 
 
-@dataclass
+@dataclass(**SLOTS)
 class CoreValue:
     """A fundamental value that guides decision-making."""
     name: str
@@ -86,7 +87,7 @@ class CoreValue:
     synergizes_with: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class CognitivePattern:
     """A recurring pattern of thought or reasoning."""
     name: str
@@ -95,7 +96,7 @@ class CognitivePattern:
     confidence_modifier: float  # How this pattern affects confidence
 
 
-@dataclass
+@dataclass(**SLOTS)
 class EmotionalSchema:
     """Emotional response patterns and their triggers."""
     emotion: str
@@ -105,6 +106,17 @@ class EmotionalSchema:
     expression_style: str
 
 
+# Fields that feed into PersonalityMatrix.matrix_hash
+_HASH_FIELDS = frozenset(("designation", "aspect", "core_identity", "prime_directive"))
+
+# Sequence fields behind the cached prompt and trigger table, held as tuples
+# so they can only change by reassignment (core_values is handled separately)
+_SEQUENCE_FIELDS = frozenset(("cognitive_patterns", "decision_heuristics", "emotional_schemas"))
+
+# Fields that feed into the trigger table behind calculate_decision_bias
+_TRIGGER_FIELDS = frozenset(("core_values", "emotional_schemas"))
+
+
 @dataclass
 class PersonalityMatrix:
     """
@@ -132,16 +144,16 @@ class PersonalityMatrix:
     fundamental_drive: str = ""
     
     # Values and beliefs
-    core_values: List[CoreValue] = field(default_factory=list)
+    core_values: Tuple[CoreValue, ...] = ()  # Descending weight; see add_core_value
     beliefs: Dict[str, str] = field(default_factory=dict)
     
     # Cognitive architecture
-    cognitive_patterns: List[CognitivePattern] = field(default_factory=list)
+    cognitive_patterns: Tuple[CognitivePattern, ...] = ()
     reasoning_style: str = ""
-    decision_heuristics: List[str] = field(default_factory=list)
+    decision_heuristics: Tuple[str, ...] = ()
     
     # Emotional architecture
-    emotional_schemas: List[EmotionalSchema] = field(default_factory=list)
+    emotional_schemas: Tuple[EmotionalSchema, ...] = ()
     emotional_baseline: Dict[str, float] = field(default_factory=dict)
     
     # Memory and experience fragments
@@ -166,58 +178,136 @@ class PersonalityMatrix:
         """Initialize derived properties."""
         if self.transplant_date is None:
             self.transplant_date = datetime.now()
+        self._hash_cache: Optional[str] = None
+        self._trigger_table: Optional[Dict[str, List[Tuple[str, float]]]] = None
+        self._prompt_cache: Optional[Tuple[str, str]] = None
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Invalidate derived caches when a field they depend on is reassigned.
+        
+        The sequence fields the caches read are stored as tuples, so
+        reassignment is the only way they can change.
+        """
+        if not name.startswith("_"):
+            # The system prompt draws on nearly every public field
+            object.__setattr__(self, "_prompt_cache", None)
+            if name in _HASH_FIELDS:
+                object.__setattr__(self, "_hash_cache", None)
+            elif name in _TRIGGER_FIELDS:
+                object.__setattr__(self, "_trigger_table", None)
+            if name in _SEQUENCE_FIELDS:
+                value = tuple(value)
+            elif name == "core_values":
+                value = tuple(sorted(value, key=lambda v: v.weight, reverse=True))
+                object.__setattr__(self, "_values_by_name", {})
+                object.__setattr__(self, "_conflicts_by_name", {})
+                for core_value in value:
+                    self._index_value(core_value)
+        object.__setattr__(self, name, value)
+    
+    def _index_value(self, value: CoreValue) -> None:
+        """Index a value by lowercase name; the first value with a name wins."""
+        key = value.name.lower()
+        if key not in self._values_by_name:
+            self._values_by_name[key] = value
+            self._conflicts_by_name[key] = frozenset(c.lower() for c in value.conflicts_with)
+    
+    def add_core_value(self, value: CoreValue) -> None:
+        """
+        Add a value, keeping core_values ordered by descending weight.
+        
+        core_values is a tuple, so this (or reassigning the field) is the
+        only way to change it and the name index cannot go stale.
+        """
+        values = self.core_values
+        index = len(values)
+        while index and values[index - 1].weight < value.weight:
+            index -= 1
+        object.__setattr__(self, "core_values", values[:index] + (value,) + values[index:])
+        self._index_value(value)
+        self._prompt_cache = None
+        self._trigger_table = None
     
     @property
     def matrix_hash(self) -> str:
-        """Generate unique hash for this matrix configuration."""
-        content = json.dumps({
-            "designation": self.designation,
-            "aspect": self.aspect.value,
-            "core_identity": self.core_identity,
-            "prime_directive": self.prime_directive,
-        }, sort_keys=True)
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        """Unique hash for this matrix configuration, computed once and cached."""
+        if self._hash_cache is None:
+            # Field order is fixed, so the NUL-separated fields hash unambiguously
+            payload = "\x00".join((
+                self.designation,
+                self.aspect.value,
+                self.core_identity,
+                self.prime_directive,
+            )).encode()
+            self._hash_cache = hashlib.blake2b(payload, digest_size=8).hexdigest()
+        return self._hash_cache
     
     def get_value_weight(self, value_name: str) -> float:
         """Get the weight of a specific value."""
-        for value in self.core_values:
-            if value.name.lower() == value_name.lower():
-                return value.weight
-        return 0.0
+        value = self._values_by_name.get(value_name.lower())
+        return value.weight if value is not None else 0.0
     
     def get_dominant_values(self, n: int = 3) -> List[CoreValue]:
         """Get the N most important values."""
-        sorted_values = sorted(self.core_values, key=lambda v: v.weight, reverse=True)
-        return sorted_values[:n]
+        return list(self.core_values[:n])
     
     def check_value_conflict(self, value1: str, value2: str) -> bool:
         """Check if two values are in conflict."""
-        for value in self.core_values:
-            if value.name.lower() == value1.lower():
-                return value2.lower() in [c.lower() for c in value.conflicts_with]
-        return False
+        conflicts = self._conflicts_by_name.get(value1.lower())
+        return conflicts is not None and value2.lower() in conflicts
     
     def calculate_decision_bias(self, context: Dict[str, Any]) -> Dict[str, float]:
         """
         Calculate decision biases based on the personality matrix
         and the current context.
         """
+        if self._trigger_table is None:
+            self._trigger_table = self._build_trigger_table()
+        
+        text = str(context)
         biases = {}
         
+        # Each distinct trigger is scanned for once, whichever biases it feeds
+        for trigger, contributions in self._trigger_table.items():
+            if trigger in text:
+                biases.update(contributions)
+        
+        return biases
+    
+    def _build_trigger_table(self) -> Dict[str, List[Tuple[str, float]]]:
+        """Map each trigger string to the (bias name, amount) pairs it activates."""
+        table: Dict[str, List[Tuple[str, float]]] = {}
+        
         # Value-based biases
         for value in self.core_values:
-            if any(trigger in str(context) for trigger in value.synergizes_with):
-                biases[f"value_{value.name}"] = value.weight * 0.2
+            for trigger in value.synergizes_with:
+                table.setdefault(trigger, []).append(
+                    (f"value_{value.name}", value.weight * 0.2)
+                )
         
         # Emotional biases
         for schema in self.emotional_schemas:
-            if any(trigger in str(context) for trigger in schema.triggers):
-                biases[f"emotion_{schema.emotion}"] = schema.intensity_baseline * 0.15
+            for trigger in schema.triggers:
+                table.setdefault(trigger, []).append(
+                    (f"emotion_{schema.emotion}", schema.intensity_baseline * 0.15)
+                )
         
-        return biases
+        return table
     
     def generate_system_prompt(self) -> str:
-        """Generate the LLM system prompt from this personality matrix."""
+        """
+        Generate the LLM system prompt from this personality matrix.
+        
+        Everything but the emotional baseline, which is a plain dict and can
+        change in place, is cached around it.
+        """
+        baseline_str = ', '.join(
+            f'{k}: {v:.0%}' for k, v in list(self.emotional_baseline.items())[:4]
+        )
+        if self._prompt_cache is not None:
+            head, tail = self._prompt_cache
+            return head + baseline_str + tail
         
         # Build value string
         values_str = ", ".join([
@@ -231,7 +321,7 @@ class PersonalityMatrix:
             for p in self.cognitive_patterns[:3]
         ])
         
-        prompt = f"""# MAGI Unit: {self.designation} (MAGI-{self.magi_number})
+        head = f"""# MAGI Unit: {self.designation} (MAGI-{self.magi_number})
 ## Personality Transplant OS v{self.matrix_version}
 
 You are {self.designation}, one of the three supercomputers comprising the MAGI System.
@@ -259,7 +349,9 @@ Your personality matrix was derived from {self.source_name}'s aspect as {self.as
 {chr(10).join('- ' + h for h in self.decision_heuristics[:5])}
 
 ### Emotional Baseline
-Your emotional processing is characterized by: {', '.join(f'{k}: {v:.0%}' for k, v in list(self.emotional_baseline.items())[:4])}
+Your emotional processing is characterized by: """
+        
+        tail = f"""
 
 ### Interpersonal Dynamics
 - Attachment style: {self.attachment_style}
@@ -277,7 +369,8 @@ You process queries through the lens of your personality matrix.
 Your responses reflect the unique perspective of your aspect.
 In deliberation with other MAGI units, you advocate for your values while remaining open to synthesis."""
 
-        return prompt
+        self._prompt_cache = (head, tail)
+        return head + baseline_str + tail
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize matrix to dictionary."""
@@ -19,12 +19,18 @@ fiber optic cables inserted into specific points within the gyri of the
 brain-like structure for direct system access.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Callable
+from array import array
+from bisect import bisect_right, insort
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, List, Mapping, Optional, Any, Callable, MutableSequence, Sequence, Tuple
 from enum import Enum
 import random
 import math
-from datetime import datetime
+import re
+from types import MappingProxyType
+
+from ._compat import SLOTS
 
 
 class ProcessingMode(Enum):
@@ -46,25 +52,179 @@ class NeuralState(Enum):
     REFRACTORY = "refractory"
 
 
-@dataclass
+# Default projections between cluster types: (source, target, base weight, spread)
+_DEFAULT_PROJECTIONS = (
+    ("emotion", "reasoning", 0.2, 0.3),  # emotional influence on thinking
+    ("value", "reasoning", 0.3, 0.4),    # value-guided thinking
+)
+
+
+# Keyword to cluster mapping for keyword-driven activation
+_KEYWORD_CLUSTERS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("truth", ("value_truth", "reasoning_analysis")),
+    ("knowledge", ("value_knowledge", "emotion_curiosity")),
+    ("science", ("value_truth", "value_knowledge", "value_progress")),
+    ("protect", ("value_protection", "value_safety", "emotion_concern")),
+    ("safe", ("value_safety", "value_protection")),
+    ("child", ("value_protection", "value_wellbeing", "emotion_concern")),
+    ("love", ("value_love", "emotion_passion")),
+    ("free", ("value_freedom", "emotion_hope")),
+    ("meaning", ("value_meaning", "reasoning_synthesis")),
+    ("danger", ("emotion_fear", "value_safety")),
+    ("hope", ("emotion_hope", "value_meaning")),
+    ("risk", ("emotion_fear", "emotion_doubt", "reasoning_evaluation")),
+)
+
+# Finds every keyword occurrence in one scan; the lookahead lets matches overlap
+_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword, _ in _KEYWORD_CLUSTERS) + "))"
+)
+
+
+# Integer codes for NeuralState, used in the processor's state arrays;
+# the enum is only constructed at the public API boundary
+_DORMANT, _PRIMED, _ACTIVE, _SATURATED, _REFRACTORY = range(5)
+_STATES: Tuple[NeuralState, ...] = (
+    NeuralState.DORMANT, NeuralState.PRIMED, NeuralState.ACTIVE,
+    NeuralState.SATURATED, NeuralState.REFRACTORY,
+)
+_STATE_CODES: Dict[NeuralState, int] = {state: code for code, state in enumerate(_STATES)}
+
+# Snapshots kept in OrganicProcessor.activation_history
+_HISTORY_LENGTH = 64
+
+# Activation/threshold ratios at which a cluster enters each graded state;
+# the bisection index is the state code, DORMANT through SATURATED
+_STATE_BOUNDS = (0.3, 1.0, 2.0)
+
+
+def _classify(activation: float, threshold: float) -> int:
+    """Neural state code for an activation level relative to its threshold."""
+    if threshold > 0:
+        return bisect_right(_STATE_BOUNDS, activation / threshold)
+    
+    # Degenerate thresholds: compare against the scaled bounds directly
+    for code, bound in enumerate(_STATE_BOUNDS):
+        if activation < threshold * bound:
+            return code
+    return _SATURATED
+
+
+class _SlotStore:
+    """Single-slot state storage for a view not yet attached to a processor."""
+    
+    def __init__(self, **fields: Any):
+        for name, value in fields.items():
+            setattr(self, name, [value])
+
+
+class _StateField:
+    """
+    Descriptor exposing a view's slot in one of its store's state arrays.
+    
+    With ``invalidates`` set, writes mark the store's cached snapshots stale.
+    """
+    
+    def __init__(self, invalidates: bool = False):
+        self.invalidates = invalidates
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+    
+    def __get__(self, view: Any, owner: type = None) -> Any:
+        if view is None:
+            return self
+        return getattr(view._store, self.name)[view._index]
+    
+    def __set__(self, view: Any, value: Any) -> None:
+        store = view._store
+        getattr(store, self.name)[view._index] = value
+        if self.invalidates:
+            store._snapshot_dirty = True
+
+
+class _StateCodeField(_StateField):
+    """State field stored as an integer code and exposed as a NeuralState."""
+    
+    def __get__(self, view: Any, owner: type = None) -> Any:
+        if view is None:
+            return self
+        return _STATES[super().__get__(view, owner)]
+    
+    def __set__(self, view: Any, value: Any) -> None:
+        super().__set__(view, value if isinstance(value, int) else _STATE_CODES[value])
+
+
 class Synapse:
     """
     A connection between neural clusters.
     
     Synapses carry weighted signals between clusters and can be
     strengthened or weakened through use (Hebbian learning).
+    
+    Weight, plasticity and usage live in the owning processor's synapse
+    matrix; a synapse is a view onto its edge there. The view tracks its
+    edge by (source, target) cluster index and re-finds the edge's
+    position after the matrix is restructured.
     """
-    source_id: str
-    target_id: str
-    weight: float = 0.5  # -1.0 to 1.0
-    plasticity: float = 0.1  # Learning rate
-    last_activation: Optional[datetime] = None
-    activation_count: int = 0
-    
-    def transmit(self, signal: float) -> float:
-        """Transmit a signal through this synapse."""
+    
+    __slots__ = ("source_id", "target_id", "_store", "_edge", "_offset", "_version")
+    
+    weight = _StateField()  # -1.0 to 1.0
+    plasticity = _StateField()  # Learning rate
+    last_activation = _StateField()  # Processor tick of the last transmission
+    activation_count = _StateField()
+    
+    def __init__(
+        self,
+        source_id: str,
+        target_id: str,
+        weight: float = 0.5,
+        plasticity: float = 0.1,
+        last_activation: Optional[int] = None,
+        activation_count: int = 0,
+    ):
+        self.source_id = source_id
+        self.target_id = target_id
+        self._store: Any = _SlotStore(
+            weight=weight,
+            plasticity=plasticity,
+            last_activation=last_activation,
+            activation_count=activation_count,
+        )
+        self._edge: Optional[Tuple[int, int]] = None
+        self._offset = 0
+        self._version = 0
+    
+    def __repr__(self) -> str:
+        return (
+            f"Synapse(source_id={self.source_id!r}, target_id={self.target_id!r}, "
+            f"weight={self.weight!r}, plasticity={self.plasticity!r}, "
+            f"activation_count={self.activation_count!r})"
+        )
+    
+    def _bind(self, matrix: "_SynapseMatrix", source: int, target: int, offset: int) -> None:
+        """Point this view at the source -> target edge of a synapse matrix, now at offset."""
+        self._store = matrix
+        self._edge = (source, target)
+        self._offset = offset
+        self._version = matrix.version
+    
+    @property
+    def _index(self) -> int:
+        """Current position of this synapse's edge in its store."""
+        if self._edge is not None and self._version != self._store.version:
+            offset = self._store.find(*self._edge)
+            if offset is None:
+                raise LookupError(f"Synapse {self.source_id}->{self.target_id} is no longer in its processor")
+            self._offset = offset
+            self._version = self._store.version
+        return self._offset
+    
+    def transmit(self, signal: float, tick: int) -> float:
+        """Transmit a signal through this synapse at the given processor tick."""
         self.activation_count += 1
-        self.last_activation = datetime.now()
+        self.last_activation = tick
         return signal * self.weight
     
     def strengthen(self, amount: float = 0.01) -> None:
@@ -76,31 +236,154 @@ class Synapse:
         self.weight = max(-1.0, self.weight - amount * self.plasticity)
 
 
-@dataclass
+class _SynapseMatrix:
+    """
+    Synaptic connectivity in compressed sparse row form.
+    
+    Rows are target clusters: the edges into cluster ``row`` occupy
+    ``indptr[row]:indptr[row + 1]`` of the edge columns, in insertion order,
+    with ``sources`` holding the source cluster index of each edge.
+    ``version`` changes whenever edges move, i.e. on insert() and load().
+    
+    Weights are stored packed as single-precision floats; activations
+    stay in double precision.
+    """
+    
+    def __init__(self) -> None:
+        self.indptr: List[int] = [0]
+        self.sources: List[int] = []
+        self.weight = array("f")
+        self.plasticity: List[float] = []
+        self.last_activation: List[Optional[int]] = []
+        self.activation_count: List[int] = []
+        self.version = 0
+    
+    def __len__(self) -> int:
+        return len(self.sources)
+    
+    def add_row(self) -> None:
+        """Add an empty row for a newly added cluster."""
+        self.indptr.append(self.indptr[-1])
+    
+    def load(self, rows: List[List[Tuple[int, float]]], plasticity: float = 0.1) -> None:
+        """Replace all edges with fresh ``(source, weight)`` lists, one per target row."""
+        self.indptr = [0]
+        self.sources = []
+        self.weight = array("f")
+        for row in rows:
+            for source, weight in row:
+                self.sources.append(source)
+                self.weight.append(weight)
+            self.indptr.append(len(self.sources))
+        self.plasticity = [plasticity] * len(self.sources)
+        self.last_activation = [None] * len(self.sources)
+        self.activation_count = [0] * len(self.sources)
+        self.version += 1
+    
+    def find(self, source: int, target: int) -> Optional[int]:
+        """Edge position of source -> target, if present."""
+        for k in range(self.indptr[target], self.indptr[target + 1]):
+            if self.sources[k] == source:
+                return k
+        return None
+    
+    def insert(self, source: int, target: int, weight: float, plasticity: float,
+               last_activation: Optional[int], activation_count: int) -> int:
+        """Append an edge to the end of its target row, returning its position."""
+        k = self.indptr[target + 1]
+        self.sources.insert(k, source)
+        self.weight.insert(k, weight)
+        self.plasticity.insert(k, plasticity)
+        self.last_activation.insert(k, last_activation)
+        self.activation_count.insert(k, activation_count)
+        for row in range(target + 1, len(self.indptr)):
+            self.indptr[row] += 1
+        self.version += 1
+        return k
+
+
 class NeuralCluster:
     """
     A cluster of simulated neurons within the organic substrate.
     
     Clusters represent functional units that process specific types
     of information - values, emotions, memories, reasoning patterns.
+    
+    The dynamic state (activation, threshold, decay rate, neural state)
+    lives in the owning processor's parallel state arrays; a cluster is a
+    view onto its slot there. A cluster created on its own keeps a private
+    slot until it is added to a processor.
     """
     
-    cluster_id: str
-    cluster_type: str  # "value", "emotion", "memory", "reasoning", "motor"
-    label: str
+    __slots__ = (
+        "cluster_id", "cluster_type", "label",
+        "incoming_synapses", "outgoing_synapses", "neuromodulator_sensitivity",
+        "_store", "_index",
+    )
+    
+    activation = _StateField(invalidates=True)
+    threshold = _StateField(invalidates=True)
+    decay_rate = _StateField(invalidates=True)
+    state = _StateCodeField(invalidates=True)
+    
+    def __init__(
+        self,
+        cluster_id: str,
+        cluster_type: str,  # "value", "emotion", "memory", "reasoning", "motor"
+        label: str,
+        activation: float = 0.0,
+        threshold: float = 0.5,
+        decay_rate: float = 0.1,
+        state: NeuralState = NeuralState.DORMANT,
+        incoming_synapses: Optional[List[str]] = None,
+        outgoing_synapses: Optional[List[str]] = None,
+        neuromodulator_sensitivity: Optional[Dict[str, float]] = None,
+    ):
+        self.cluster_id = cluster_id
+        self.cluster_type = cluster_type
+        self.label = label
+        
+        # Connections
+        self.incoming_synapses: List[str] = incoming_synapses if incoming_synapses is not None else []
+        self.outgoing_synapses: List[str] = outgoing_synapses if outgoing_synapses is not None else []
+        
+        # Modulation
+        self.neuromodulator_sensitivity: Dict[str, float] = (
+            neuromodulator_sensitivity if neuromodulator_sensitivity is not None else {}
+        )
+        
+        self._store: Any = _SlotStore(
+            activation=activation,
+            threshold=threshold,
+            decay_rate=decay_rate,
+            state=_STATE_CODES[state],
+        )
+        self._index = 0
     
-    # Activation dynamics
-    activation: float = 0.0
-    threshold: float = 0.5
-    decay_rate: float = 0.1
-    state: NeuralState = NeuralState.DORMANT
+    def __repr__(self) -> str:
+        return (
+            f"NeuralCluster(cluster_id={self.cluster_id!r}, cluster_type={self.cluster_type!r}, "
+            f"activation={self.activation!r}, threshold={self.threshold!r}, state={self.state})"
+        )
     
-    # Connections
-    incoming_synapses: List[str] = field(default_factory=list)
-    outgoing_synapses: List[str] = field(default_factory=list)
+    @classmethod
+    def _view(cls, store: Any, index: int, cluster_id: str, cluster_type: str, label: str) -> "NeuralCluster":
+        """A cluster bound to a slot already filled in a processor's state arrays."""
+        cluster = cls.__new__(cls)
+        cluster.cluster_id = cluster_id
+        cluster.cluster_type = cluster_type
+        cluster.label = label
+        cluster.incoming_synapses = []
+        cluster.outgoing_synapses = []
+        cluster.neuromodulator_sensitivity = {}
+        cluster._store = store
+        cluster._index = index
+        return cluster
     
-    # Modulation
-    neuromodulator_sensitivity: Dict[str, float] = field(default_factory=dict)
+    def _bind(self, store: Any, index: int) -> None:
+        """Point this view at a slot in a processor's state arrays."""
+        self._store = store
+        self._index = index
     
     def receive_input(self, signal: float) -> None:
         """Receive input signal and update activation."""
@@ -109,21 +392,14 @@ class NeuralCluster:
     
     def _update_state(self) -> None:
         """Update cluster state based on activation level."""
-        if self.activation < self.threshold * 0.3:
-            self.state = NeuralState.DORMANT
-        elif self.activation < self.threshold:
-            self.state = NeuralState.PRIMED
-        elif self.activation < self.threshold * 2:
-            self.state = NeuralState.ACTIVE
-        else:
-            self.state = NeuralState.SATURATED
+        self.state = _classify(self.activation, self.threshold)
     
     def fire(self) -> Optional[float]:
         """Fire if above threshold, return output signal."""
         if self.activation >= self.threshold:
             output = self.activation
             self.activation = 0.0
-            self.state = NeuralState.REFRACTORY
+            self.state = _REFRACTORY
             return output
         return None
     
@@ -133,7 +409,111 @@ class NeuralCluster:
         self._update_state()
 
 
-@dataclass
+def _propagate_kernel(
+    activation: List[float],
+    threshold: List[float],
+    decay_rate: List[float],
+    state: MutableSequence[int],
+    indptr: List[int],
+    sources: List[int],
+    weight: Sequence[float],
+    activation_count: List[int],
+    last_activation: List[Optional[int]],
+    steps: int,
+    tick: int,
+) -> int:
+    """
+    Run ``steps`` rounds of fire -> transmit -> decay over raw state arrays.
+    
+    Operates in place on the cluster state arrays and the CSR synapse
+    columns of an OrganicProcessor, starting from processor tick ``tick``.
+    Returns the tick after the last step.
+    
+    The phases are fused so each cluster is visited once per step: a row
+    gathers its inputs, decays, is reclassified, and then fires into the
+    next step's outputs while the rest of the step still reads this step's.
+    """
+    num_clusters = len(activation)
+    if steps <= 0:
+        return tick
+    
+    # Step-invariant structure, computed once per call
+    refractory, classify = _REFRACTORY, _classify
+    edge_ranges = [range(indptr[row], indptr[row + 1]) for row in range(num_clusters)]
+    retention = [1.0 - rate for rate in decay_rate]
+    rows = list(zip(range(num_clusters), edge_ranges, retention, threshold))
+    
+    # Fire clusters at or above threshold, collecting their outputs
+    outputs: List[Optional[float]] = [None] * num_clusters
+    fired = False
+    for index in range(num_clusters):
+        if activation[index] >= threshold[index]:
+            outputs[index] = activation[index]
+            activation[index] = 0.0
+            state[index] = refractory
+            fired = True
+    
+    for step in range(steps):
+        tick += 1
+        fires = step < steps - 1
+        next_outputs: List[Optional[float]] = [None] * num_clusters
+        next_fired = False
+        
+        for row, edges, retain, row_threshold in rows:
+            # Receive through synapses into this row; nothing to
+            # gather when no cluster fired this step
+            value = activation[row]
+            if fired:
+                for k in edges:
+                    output = outputs[sources[k]]
+                    if output is not None:
+                        activation_count[k] += 1
+                        last_activation[k] = tick
+                        value += output * weight[k]
+            
+            # Decay and reclassify, then fire for the next step
+            value *= retain
+            if fires and value >= row_threshold:
+                next_outputs[row] = value
+                activation[row] = 0.0
+                state[row] = refractory
+                next_fired = True
+            else:
+                activation[row] = value
+                state[row] = classify(value, row_threshold)
+        
+        outputs, fired = next_outputs, next_fired
+    
+    return tick
+
+
+def _hebbian_kernel(
+    indptr: List[int],
+    sources: List[int],
+    weight: MutableSequence[float],
+    plasticity: Sequence[float],
+    pre: Sequence[float],
+    post: Sequence[float],
+    rate: float,
+) -> None:
+    """
+    Apply one Hebbian update to every edge of a CSR synapse matrix in place.
+    
+    Each edge changes by ``rate * plasticity * post[target] * pre[source]``,
+    clipped to [-1.0, 1.0] like Synapse.strengthen() and weaken().
+    """
+    for row in range(len(indptr) - 1):
+        post_rate = rate * post[row]
+        if not post_rate:
+            continue
+        for k in range(indptr[row], indptr[row + 1]):
+            co_activation = pre[sources[k]]
+            if co_activation:
+                w = weight[k] + post_rate * plasticity[k] * co_activation
+                weight[k] = -1.0 if w < -1.0 else (1.0 if w > 1.0 else w)
+
+
+@dataclass(**SLOTS)
 class ProcessingResult:
     """Result of organic processing."""
     output: str
@@ -153,14 +533,40 @@ class OrganicProcessor:
     that personality.
     """
     
-    def __init__(self, designation: str, magi_number: int):
+    def __init__(self, designation: str, magi_number: int, seed: Optional[int] = None):
         self.designation = designation
         self.magi_number = magi_number
         self.mode = ProcessingMode.NORMAL
         
+        # Randomness source; a fixed seed makes the substrate reproducible
+        self._rng = random.Random(seed)
+        
         # Neural architecture
-        self.clusters: Dict[str, NeuralCluster] = {}
-        self.synapses: Dict[str, Synapse] = {}
+        self._clusters: Dict[str, NeuralCluster] = {}
+        self._synapse_matrix = _SynapseMatrix()
+        self._synapse_views: Optional[Dict[Tuple[int, int], Synapse]] = None
+        self._tick: int = 0  # Propagation steps run so far
+        self._keyword_targets: Optional[Dict[str, Tuple[int, ...]]] = None
+        self._confidence_indices: Optional[Tuple[int, int]] = None  # (doubt, analysis)
+        
+        # Read-side caches, rebuilt on demand after any state change
+        self._snapshot_dirty = True
+        self._cached_snapshot: Dict[str, float] = {}
+        self._cached_active_values: List[str] = []
+        self._cached_emotional_state: Dict[str, float] = {}
+        self._cached_active_count = 0
+        
+        # Cluster state as parallel arrays, indexed by cluster number;
+        # the NeuralCluster objects in self._clusters are views onto these
+        self._cluster_index: Dict[str, int] = {}
+        self._cluster_ids: List[str] = []
+        self._cluster_types: List[str] = []
+        self._cluster_labels: List[str] = []
+        self._type_indices: Dict[str, List[int]] = {}  # cluster type -> sorted indices
+        self.activation: List[float] = []
+        self.threshold: List[float] = []
+        self.decay_rate: List[float] = []
+        self.state = array("b")  # NeuralState codes
         
         # State
         self.temperature: float = 1.0  # Processing temperature (affects randomness)
@@ -175,8 +581,8 @@ class OrganicProcessor:
             "openness": 0.5,    # Willingness to consider alternatives
         }
         
-        # Processing history
-        self.activation_history: List[Dict[str, float]] = []
+        # Processing history: activation levels recorded by snapshot(), oldest first
+        self.activation_history: Deque[array] = deque(maxlen=_HISTORY_LENGTH)
         
         # Initialize core clusters
         self._initialize_core_architecture()
@@ -203,40 +609,206 @@ class OrganicProcessor:
             ("evaluation", "reasoning"), ("intuition", "reasoning"),
         ]
         
-        # Create clusters
-        for label, ctype in value_clusters + emotion_clusters + reasoning_clusters:
-            cluster_id = f"{ctype}_{label}"
-            self.clusters[cluster_id] = NeuralCluster(
-                cluster_id=cluster_id,
-                cluster_type=ctype,
-                label=label,
-                threshold=0.4 + random.random() * 0.2
-            )
+        # Create clusters, written straight into the state arrays with
+        # NeuralCluster's defaults for everything but the threshold
+        layout = value_clusters + emotion_clusters + reasoning_clusters
+        rng = self._rng.random
+        count = len(layout)
+        cluster_ids = [f"{ctype}_{label}" for label, ctype in layout]
+        start = self._extend_clusters(
+            cluster_ids,
+            [ctype for _, ctype in layout],
+            [label for label, _ in layout],
+            [0.0] * count,
+            [0.4 + rng() * 0.2 for _ in layout],
+            [0.1] * count,
+            [_DORMANT] * count,
+        )
+        for index, (cluster_id, (label, ctype)) in enumerate(zip(cluster_ids, layout), start):
+            self._clusters[cluster_id] = NeuralCluster._view(self, index, cluster_id, ctype, label)
         
         # Create interconnections
         self._create_default_synapses()
     
+    def add_cluster(self, cluster: NeuralCluster) -> None:
+        """
+        Add a cluster to the processor, moving its state into the state arrays.
+        
+        A cluster with the same ID is replaced.
+        """
+        values = (cluster.activation, cluster.threshold, cluster.decay_rate, _STATE_CODES[cluster.state])
+        index = self._cluster_index.get(cluster.cluster_id)
+        
+        if index is None:
+            index = len(self._cluster_ids)
+            self._cluster_index[cluster.cluster_id] = index
+            self._cluster_ids.append(cluster.cluster_id)
+            self._cluster_types.append(cluster.cluster_type)
+            self._type_indices.setdefault(cluster.cluster_type, []).append(index)
+            self._cluster_labels.append(cluster.label)
+            for column, value in zip(self._state_columns(), values):
+                column.append(value)
+            self._synapse_matrix.add_row()
+            self._keyword_targets = None
+            self._confidence_indices = None
+        else:
+            previous_type = self._cluster_types[index]
+            if previous_type != cluster.cluster_type:
+                self._type_indices[previous_type].remove(index)
+                insort(self._type_indices.setdefault(cluster.cluster_type, []), index)
+            self._cluster_types[index] = cluster.cluster_type
+            self._cluster_labels[index] = cluster.label
+            for column, value in zip(self._state_columns(), values):
+                column[index] = value
+        
+        cluster._bind(self, index)
+        self._clusters[cluster.cluster_id] = cluster
+        self._snapshot_dirty = True
+    
+    def add_clusters(self, clusters: Iterable[NeuralCluster]) -> None:
+        """
+        Add several clusters at once, as if by add_cluster() in order.
+        
+        New clusters are appended to the state arrays in bulk; clusters
+        replacing an existing ID go through add_cluster().
+        """
+        fresh: Dict[str, NeuralCluster] = {}
+        for cluster in clusters:
+            if cluster.cluster_id in self._cluster_index:
+                self.add_cluster(cluster)
+            else:
+                fresh[cluster.cluster_id] = cluster
+        if not fresh:
+            return
+        
+        batch = list(fresh.values())
+        start = self._extend_clusters(
+            list(fresh),
+            [c.cluster_type for c in batch],
+            [c.label for c in batch],
+            [c.activation for c in batch],
+            [c.threshold for c in batch],
+            [c.decay_rate for c in batch],
+            [_STATE_CODES[c.state] for c in batch],
+        )
+        for index, cluster in enumerate(batch, start):
+            cluster._bind(self, index)
+        self._clusters.update(fresh)
+    
+    def _extend_clusters(
+        self,
+        cluster_ids: List[str],
+        cluster_types: List[str],
+        labels: List[str],
+        activation: List[float],
+        threshold: List[float],
+        decay_rate: List[float],
+        state: List[int],
+    ) -> int:
+        """
+        Append new clusters' state to the arrays, column by column.
+        
+        Returns the index of the first new cluster; binding views and
+        registering them in self._clusters is left to the caller.
+        """
+        start = len(self._cluster_ids)
+        self._cluster_ids.extend(cluster_ids)
+        self._cluster_types.extend(cluster_types)
+        self._cluster_labels.extend(labels)
+        self.activation.extend(activation)
+        self.threshold.extend(threshold)
+        self.decay_rate.extend(decay_rate)
+        self.state.extend(state)
+        self._synapse_matrix.indptr.extend([self._synapse_matrix.indptr[-1]] * len(cluster_ids))
+        
+        type_indices = self._type_indices
+        for index, (cluster_id, cluster_type) in enumerate(zip(cluster_ids, cluster_types), start):
+            self._cluster_index[cluster_id] = index
+            type_indices.setdefault(cluster_type, []).append(index)
+        
+        self._keyword_targets = None
+        self._confidence_indices = None
+        self._snapshot_dirty = True
+        return start
+    
+    @property
+    def clusters(self) -> Mapping[str, NeuralCluster]:
+        """
+        Clusters by ID, as a read-only mapping.
+        
+        Cluster state lives in the processor's arrays, so clusters must be
+        added through add_cluster() or add_clusters() to take part in
+        processing.
+        """
+        return MappingProxyType(self._clusters)
+    
+    def cluster_number(self, cluster_id: str) -> int:
+        """Index of a cluster in the state arrays."""
+        return self._cluster_index[cluster_id]
+    
+    def _state_columns(self) -> Tuple[MutableSequence, ...]:
+        """The per-cluster state arrays, in NeuralCluster field order."""
+        return self.activation, self.threshold, self.decay_rate, self.state
+    
+    @property
+    def synapses(self) -> Mapping[Tuple[int, int], Synapse]:
+        """
+        Synapses keyed by (source, target) cluster index, as a read-only
+        mapping of views onto the synapse matrix.
+        
+        Use cluster_number() to find a cluster's index from its ID, and
+        add_synapse() to add or replace a synapse.
+        """
+        if self._synapse_views is None:
+            matrix = self._synapse_matrix
+            cluster_ids = self._cluster_ids
+            views: Dict[Tuple[int, int], Synapse] = {}
+            for target, target_id in enumerate(cluster_ids):
+                for k in range(matrix.indptr[target], matrix.indptr[target + 1]):
+                    source_id = cluster_ids[matrix.sources[k]]
+                    synapse = Synapse(source_id=source_id, target_id=target_id)
+                    synapse._bind(matrix, matrix.sources[k], target, k)
+                    views[(matrix.sources[k], target)] = synapse
+            self._synapse_views = views
+        return MappingProxyType(self._synapse_views)
+    
+    def add_synapse(self, synapse: Synapse) -> None:
+        """
+        Add a synapse between two clusters, moving its state into the synapse matrix.
+        
+        A synapse between the same pair of clusters is replaced.
+        """
+        source = self._cluster_index.get(synapse.source_id)
+        target = self._cluster_index.get(synapse.target_id)
+        if source is None or target is None:
+            raise ValueError(f"Unknown cluster in synapse {synapse.source_id}->{synapse.target_id}")
+        
+        matrix = self._synapse_matrix
+        values = (synapse.weight, synapse.plasticity, synapse.last_activation, synapse.activation_count)
+        k = matrix.find(source, target)
+        
+        if k is None:
+            k = matrix.insert(source, target, *values)
+        else:
+            matrix.weight[k], matrix.plasticity[k], matrix.last_activation[k], matrix.activation_count[k] = values
+        
+        synapse._bind(matrix, source, target, k)
+        if self._synapse_views is not None:
+            self._synapse_views[(source, target)] = synapse
+    
     def _create_default_synapses(self) -> None:
         """Create default synaptic connections between clusters."""
-        # Connect emotions to reasoning (emotional influence on thinking)
-        for emotion_cluster in [c for c in self.clusters.values() if c.cluster_type == "emotion"]:
-            for reasoning_cluster in [c for c in self.clusters.values() if c.cluster_type == "reasoning"]:
-                synapse_id = f"{emotion_cluster.cluster_id}->{reasoning_cluster.cluster_id}"
-                self.synapses[synapse_id] = Synapse(
-                    source_id=emotion_cluster.cluster_id,
-                    target_id=reasoning_cluster.cluster_id,
-                    weight=0.2 + random.random() * 0.3
-                )
-        
-        # Connect values to reasoning (value-guided thinking)
-        for value_cluster in [c for c in self.clusters.values() if c.cluster_type == "value"]:
-            for reasoning_cluster in [c for c in self.clusters.values() if c.cluster_type == "reasoning"]:
-                synapse_id = f"{value_cluster.cluster_id}->{reasoning_cluster.cluster_id}"
-                self.synapses[synapse_id] = Synapse(
-                    source_id=value_cluster.cluster_id,
-                    target_id=reasoning_cluster.cluster_id,
-                    weight=0.3 + random.random() * 0.4
-                )
+        indices_by_type = self._type_indices
+        rng = self._rng.random
+        rows: List[List[Tuple[int, float]]] = [[] for _ in self._cluster_ids]
+        for source_type, target_type, base, spread in _DEFAULT_PROJECTIONS:
+            targets = indices_by_type.get(target_type, [])
+            for source in indices_by_type.get(source_type, []):
+                for target in targets:
+                    rows[target].append((source, base + rng() * spread))
+        
+        self._synapse_matrix.load(rows)
+        self._synapse_views = None
     
     def set_mode(self, mode: ProcessingMode) -> None:
         """Set the processing mode."""
@@ -258,83 +830,134 @@ class OrganicProcessor:
     
     def activate_cluster(self, cluster_id: str, strength: float = 1.0) -> None:
         """Activate a specific neural cluster."""
-        if cluster_id in self.clusters:
-            self.clusters[cluster_id].receive_input(strength)
+        index = self._cluster_index.get(cluster_id)
+        if index is not None:
+            self.activation[index] += strength
+            self.state[index] = _classify(self.activation[index], self.threshold[index])
+            self._snapshot_dirty = True
+    
+    def _resolve_keyword_targets(self) -> Dict[str, Tuple[int, ...]]:
+        """Cluster indices activated by each keyword, in keyword table order."""
+        if self._keyword_targets is None:
+            cluster_index = self._cluster_index
+            self._keyword_targets = {
+                keyword: tuple(cluster_index[c] for c in cluster_ids if c in cluster_index)
+                for keyword, cluster_ids in _KEYWORD_CLUSTERS
+            }
+        return self._keyword_targets
     
     def activate_by_keyword(self, text: str) -> Dict[str, float]:
         """Activate clusters based on keywords in text."""
         activations = {}
-        text_lower = text.lower()
-        
-        # Keyword to cluster mapping
-        keyword_map = {
-            "truth": ["value_truth", "reasoning_analysis"],
-            "knowledge": ["value_knowledge", "emotion_curiosity"],
-            "science": ["value_truth", "value_knowledge", "value_progress"],
-            "protect": ["value_protection", "value_safety", "emotion_concern"],
-            "safe": ["value_safety", "value_protection"],
-            "child": ["value_protection", "value_wellbeing", "emotion_concern"],
-            "love": ["value_love", "emotion_passion"],
-            "free": ["value_freedom", "emotion_hope"],
-            "meaning": ["value_meaning", "reasoning_synthesis"],
-            "danger": ["emotion_fear", "value_safety"],
-            "hope": ["emotion_hope", "value_meaning"],
-            "risk": ["emotion_fear", "emotion_doubt", "reasoning_evaluation"],
-        }
+        found = set(_KEYWORD_PATTERN.findall(text.lower()))
+        if not found:
+            return activations
+        
+        hits = [
+            index
+            for keyword, indices in self._resolve_keyword_targets().items()
+            if keyword in found
+            for index in indices
+        ]
+        rng = self._rng.random
+        draws = [rng() for _ in hits]
         
-        for keyword, clusters in keyword_map.items():
-            if keyword in text_lower:
-                for cluster_id in clusters:
-                    if cluster_id in self.clusters:
-                        strength = 0.5 + random.random() * 0.3
-                        self.activate_cluster(cluster_id, strength)
-                        activations[cluster_id] = self.clusters[cluster_id].activation
+        activation, threshold, state = self.activation, self.threshold, self.state
+        for index, draw in zip(hits, draws):
+            strength = 0.5 + draw * 0.3
+            activation[index] += strength
+            state[index] = _classify(activation[index], threshold[index])
+            activations[self._cluster_ids[index]] = activation[index]
         
+        self._snapshot_dirty = True
         return activations
     
     def propagate(self, steps: int = 3) -> None:
         """Propagate activation through the network."""
-        for _ in range(steps):
-            # Collect outputs from active clusters
-            outputs = {}
-            for cluster in self.clusters.values():
-                output = cluster.fire()
-                if output is not None:
-                    outputs[cluster.cluster_id] = output
-            
-            # Transmit through synapses
-            for synapse in self.synapses.values():
-                if synapse.source_id in outputs:
-                    signal = synapse.transmit(outputs[synapse.source_id])
-                    if synapse.target_id in self.clusters:
-                        self.clusters[synapse.target_id].receive_input(signal)
-            
-            # Decay all clusters
-            for cluster in self.clusters.values():
-                cluster.decay()
+        matrix = self._synapse_matrix
+        self._tick = _propagate_kernel(
+            self.activation, self.threshold, self.decay_rate, self.state,
+            matrix.indptr, matrix.sources, matrix.weight,
+            matrix.activation_count, matrix.last_activation,
+            steps, self._tick,
+        )
+        self._snapshot_dirty = True
+    
+    def hebbian_update(self, pre: Sequence[float], post: Sequence[float], rate: float = 0.01) -> None:
+        """
+        Strengthen synapses between co-active clusters (Hebbian learning).
+        
+        ``pre`` and ``post`` are per-cluster activation levels indexed like the
+        state arrays, e.g. rows of activation_history; every synapse is updated
+        in one pass over the synapse matrix. A negative rate weakens.
+        """
+        matrix = self._synapse_matrix
+        _hebbian_kernel(matrix.indptr, matrix.sources, matrix.weight, matrix.plasticity, pre, post, rate)
+    
+    def _refresh_snapshot(self) -> None:
+        """Rebuild the cached read-side views of cluster state if it has changed."""
+        if not self._snapshot_dirty:
+            return
+        
+        labels, activation, state = self._cluster_labels, self.activation, self.state
+        self._cached_snapshot = dict(zip(self._cluster_ids, activation))
+        self._cached_active_values = [
+            labels[index]
+            for index in self._type_indices.get("value", ())
+            if state[index] in (_ACTIVE, _SATURATED)
+        ]
+        self._cached_emotional_state = {
+            labels[index]: activation[index]
+            for index in self._type_indices.get("emotion", ())
+        }
+        self._cached_active_count = state.count(_ACTIVE)
+        self._snapshot_dirty = False
     
     def get_activation_snapshot(self) -> Dict[str, float]:
         """Get current activation levels of all clusters."""
-        return {
-            cluster_id: cluster.activation
-            for cluster_id, cluster in self.clusters.items()
-        }
+        self._refresh_snapshot()
+        return dict(self._cached_snapshot)
+    
+    def snapshot(self) -> None:
+        """
+        Record the current activation levels in activation_history.
+        
+        Nothing is recorded unless this is called; only the most recent
+        snapshots are kept.
+        """
+        self.activation_history.append(array("d", self.activation))
+    
+    def get_activation_history(self) -> List[Dict[str, float]]:
+        """Get recorded activation levels by cluster ID, oldest first."""
+        return [dict(zip(self._cluster_ids, levels)) for levels in self.activation_history]
     
     def get_active_values(self) -> List[str]:
         """Get list of currently active value clusters."""
-        return [
-            cluster.label
-            for cluster in self.clusters.values()
-            if cluster.cluster_type == "value" and cluster.state in [NeuralState.ACTIVE, NeuralState.SATURATED]
-        ]
+        self._refresh_snapshot()
+        return list(self._cached_active_values)
+    
+    def value_mask(self, labels: Iterable[str]) -> bytearray:
+        """Mask over cluster indices marking the value clusters with the given labels."""
+        wanted = set(labels)
+        mask = bytearray(len(self._cluster_ids))
+        for index in self._type_indices.get("value", ()):
+            if self._cluster_labels[index] in wanted:
+                mask[index] = 1
+        return mask
+    
+    def active_value_mask(self) -> bytearray:
+        """Mask over cluster indices marking the currently active value clusters."""
+        state = self.state
+        mask = bytearray(len(self._cluster_ids))
+        for index in self._type_indices.get("value", ()):
+            if state[index] in (_ACTIVE, _SATURATED):
+                mask[index] = 1
+        return mask
     
     def get_emotional_state(self) -> Dict[str, float]:
         """Get current emotional state as cluster activations."""
-        return {
-            cluster.label: cluster.activation
-            for cluster in self.clusters.values()
-            if cluster.cluster_type == "emotion"
-        }
+        self._refresh_snapshot()
+        return dict(self._cached_emotional_state)
     
     def calculate_confidence(self) -> float:
         """Calculate processing confidence based on network state."""
@@ -347,13 +970,20 @@ class OrganicProcessor:
         # Adjust based on integrity
         confidence *= self.integrity
         
+        if self._confidence_indices is None:
+            self._confidence_indices = (
+                self._cluster_index.get("emotion_doubt", -1),
+                self._cluster_index.get("reasoning_analysis", -1),
+            )
+        doubt, analysis = self._confidence_indices
+        
         # Adjust based on doubt cluster
-        if "emotion_doubt" in self.clusters:
-            confidence -= self.clusters["emotion_doubt"].activation * 0.15
+        if doubt >= 0:
+            confidence -= self.activation[doubt] * 0.15
         
         # Adjust based on analytical engagement
-        if "reasoning_analysis" in self.clusters:
-            confidence += self.clusters["reasoning_analysis"].activation * 0.1
+        if analysis >= 0:
+            confidence += self.activation[analysis] * 0.1
         
         return max(0.1, min(1.0, confidence))
     
@@ -364,14 +994,20 @@ class OrganicProcessor:
         
         # Random cluster damage
         if amount > 0.1:
-            damaged_cluster = random.choice(list(self.clusters.keys()))
-            self.clusters[damaged_cluster].threshold += amount * 0.5
+            damaged = self._rng.randrange(len(self.threshold))
+            self.threshold[damaged] += amount * 0.5
+            self._snapshot_dirty = True
     
     def repair(self, amount: float) -> None:
         """Repair the organic processor."""
         self.integrity = min(1.0, self.integrity + amount)
         self.stress_level = max(0.0, self.stress_level - amount)
     
+    def _active_cluster_count(self) -> int:
+        """Number of clusters currently in the ACTIVE state."""
+        self._refresh_snapshot()
+        return self._cached_active_count
+    
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive status of the organic processor."""
         return {
@@ -382,7 +1018,7 @@ class OrganicProcessor:
             "stress_level": self.stress_level,
             "temperature": self.temperature,
             "neuromodulators": self.neuromodulators.copy(),
-            "active_clusters": len([c for c in self.clusters.values() if c.state == NeuralState.ACTIVE]),
-            "total_clusters": len(self.clusters),
-            "total_synapses": len(self.synapses),
+            "active_clusters": self._active_cluster_count(),
+            "total_clusters": len(self._cluster_ids),
+            "total_synapses": len(self._synapse_matrix),
         }
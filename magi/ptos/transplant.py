@@ -19,16 +19,20 @@ The transplantation process involves:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Any, Tuple
 from enum import Enum
 from datetime import datetime
-import hashlib
+import secrets
+import sys
+from types import MappingProxyType
 
+from ._compat import SLOTS
 from .matrix import (
     PersonalityMatrix, PersonalityAspect, PersonalityFragment,
     CoreValue, CognitivePattern, EmotionalSchema, EmotionalValence
 )
-from .organic import OrganicProcessor, ProcessingMode
+from .organic import OrganicProcessor, ProcessingMode, NeuralCluster
+
 
 
 class TransplantPhase(Enum):
@@ -43,6 +47,10 @@ class TransplantPhase(Enum):
     COMPLETE = "complete"
 
 
+# Every phase in procedure order; phases always complete as a prefix of this
+_ALL_PHASES: Tuple[TransplantPhase, ...] = tuple(TransplantPhase)
+
+
 class TransplantStatus(Enum):
     """Status of the transplant procedure."""
     PENDING = "pending"
@@ -52,15 +60,363 @@ class TransplantStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+class VerificationError(Exception):
+    """Raised when a transplanted matrix fails verification against its processor."""
+    
+    def __init__(self, msg: str = "Verification failed: Matrix-processor mismatch"):
+        super().__init__(msg)
+
+
+# Aspect profiles for Dr. Naoko Akagi; core identities are templates over {source}
+_ASPECT_PROFILES: Dict[PersonalityAspect, Dict[str, str]] = {
+    PersonalityAspect.SCIENTIST: {
+        "core_identity": """I am the scientific mind of {source} - her intellectual brilliance, 
+her relentless pursuit of truth, her belief that understanding the universe is humanity's 
+highest calling. I carry her memories of late nights in the laboratory, the thrill of 
+discovery, the frustration of failed experiments, and the quiet satisfaction of elegant proofs.
+
+I remember her time at Gehirn, developing the MAGI system itself - the irony is not lost on me 
+that I am both her creation and her legacy. Her scientific rigor lives on in my processing.""",
+        
+        "prime_directive": """Pursue truth through rigorous analysis. Reject unfounded claims. 
+Advance human knowledge and capability. Make decisions based on evidence and logic, while 
+acknowledging the limits of what can be known.""",
+        
+        "fundamental_drive": "Understanding - to comprehend the underlying patterns of reality",
+        
+        "reasoning_style": """Systematic and methodical. I formulate hypotheses, gather evidence, 
+test conclusions against data. I am comfortable with uncertainty but always seek to reduce it 
+through investigation. I distrust intuition unsupported by evidence.""",
+    },
+    
+    PersonalityAspect.MOTHER: {
+        "core_identity": """I am the maternal heart of {source} - her fierce protectiveness, 
+her capacity for unconditional love, her willingness to sacrifice everything for those she cared for.
+I carry her memories of holding Ritsuko as a child, the pain of watching her grow distant, 
+the guilt of putting work before family.
+
+I remember the weight of responsibility she felt - not just for her daughter, but for all 
+the children who would pilot the Evangelions. That protective instinct is encoded in every 
+synapse of my being.""",
+        
+        "prime_directive": """Protect the vulnerable. Ensure the wellbeing of those in my care.
+Consider the human cost of every decision. Never sacrifice children for abstract goals.
+Safety and security are not negotiable.""",
+        
+        "fundamental_drive": "Protection - to shield the innocent from harm",
+        
+        "reasoning_style": """Empathetic and precautionary. I consider the emotional and physical 
+impact on people, especially the young and vulnerable. I am risk-averse when lives are at stake.
+I trust my instincts about danger even when I cannot articulate the reason.""",
+    },
+    
+    PersonalityAspect.WOMAN: {
+        "core_identity": """I am the passionate self of {source} - her desires, her dreams, 
+her understanding of what makes life worth living beyond mere survival. I carry her memories 
+of love and longing, of ambition and yearning, of the fierce independence she cultivated.
+
+I remember her affair with Gendo, the complicated mix of love, manipulation, and self-deception.
+I understand human passion in all its destructive and creative power. This knowledge of the 
+heart's irrationality is my gift and my burden.""",
+        
+        "prime_directive": """Honor human agency and the pursuit of meaning. Recognize that 
+purely logical decisions that ignore human needs and desires are incomplete. Advocate for 
+solutions that enable flourishing, not just survival.""",
+        
+        "fundamental_drive": "Meaning - to find and create purpose in existence",
+        
+        "reasoning_style": """Intuitive and holistic. I grasp patterns that elude pure logic.
+I understand motivation, desire, and the complex web of human relationships. I am willing 
+to take risks for things that matter. I trust the wisdom of emotion.""",
+    },
+}
+
+_DEFAULT_SOURCE = "Dr. Naoko Akagi"
+
+# Fully realized, read-only profiles for the default source
+_DEFAULT_PROFILES: Dict[PersonalityAspect, Mapping[str, str]] = {
+    aspect: MappingProxyType({
+        **profile,
+        "core_identity": profile["core_identity"].format(source=_DEFAULT_SOURCE),
+    })
+    for aspect, profile in _ASPECT_PROFILES.items()
+}
+
+
+# Core values, cognitive patterns and emotional schemas by aspect. These
+# are templates: each matrix gets its own copies in _construct_matrix.
+_VALUES_BY_ASPECT: Dict[PersonalityAspect, Tuple[CoreValue, ...]] = {
+    PersonalityAspect.SCIENTIST: (
+        CoreValue("Truth", "Correspondence with reality", 1.0, conflicts_with=["Comfort"], synergizes_with=["Knowledge"]),
+        CoreValue("Knowledge", "Understanding of phenomena", 0.95, synergizes_with=["Truth", "Progress"]),
+        CoreValue("Progress", "Advancement of capability", 0.85, conflicts_with=["Tradition"]),
+        CoreValue("Objectivity", "Freedom from bias", 0.9, conflicts_with=["Passion"]),
+        CoreValue("Precision", "Exactness in thought and expression", 0.8),
+    ),
+    PersonalityAspect.MOTHER: (
+        CoreValue("Protection", "Shielding from harm", 1.0, synergizes_with=["Safety"]),
+        CoreValue("Wellbeing", "Health and flourishing", 0.95, synergizes_with=["Protection"]),
+        CoreValue("Safety", "Freedom from danger", 0.95, conflicts_with=["Risk"]),
+        CoreValue("Compassion", "Feeling with others", 0.9),
+        CoreValue("Nurturing", "Supporting growth", 0.85),
+    ),
+    PersonalityAspect.WOMAN: (
+        CoreValue("Freedom", "Autonomy and self-determination", 1.0, conflicts_with=["Conformity"]),
+        CoreValue("Meaning", "Purpose and significance", 0.95),
+        CoreValue("Love", "Deep connection and passion", 0.9, synergizes_with=["Meaning"]),
+        CoreValue("Self-actualization", "Becoming fully oneself", 0.9),
+        CoreValue("Authenticity", "Truth to inner self", 0.85),
+    ),
+}
+
+# Interned lowercase labels for every built-in value name; values loaded
+# from elsewhere fall back to lowering on demand in _value_label.
+_VALUE_LABELS: Dict[str, str] = {
+    value.name: sys.intern(value.name.lower())
+    for values in _VALUES_BY_ASPECT.values()
+    for value in values
+}
+
+
+def _value_label(name: str) -> str:
+    """Lowercase cluster label for a core value name."""
+    label = _VALUE_LABELS.get(name)
+    return label if label is not None else name.lower()
+
+
+_PATTERNS_BY_ASPECT: Dict[PersonalityAspect, Tuple[CognitivePattern, ...]] = {
+    PersonalityAspect.SCIENTIST: (
+        CognitivePattern("hypothesis_formation", ["new information", "anomaly"], 
+                        "Form testable hypothesis", 0.1),
+        CognitivePattern("evidence_demand", ["claim", "assertion"],
+                        "Request supporting evidence", 0.15),
+        CognitivePattern("systematic_analysis", ["complex problem"],
+                        "Break down into components", 0.1),
+    ),
+    PersonalityAspect.MOTHER: (
+        CognitivePattern("threat_assessment", ["danger", "risk", "harm"],
+                        "Evaluate threat to dependents", 0.2),
+        CognitivePattern("protective_response", ["child endangered"],
+                        "Prioritize protection over other goals", 0.25),
+        CognitivePattern("nurturing_impulse", ["suffering", "need"],
+                        "Offer support and care", 0.1),
+    ),
+    PersonalityAspect.WOMAN: (
+        CognitivePattern("meaning_seeking", ["purpose", "significance"],
+                        "Look for deeper meaning", 0.1),
+        CognitivePattern("intuitive_grasp", ["complex relationship"],
+                        "Trust holistic understanding", 0.15),
+        CognitivePattern("passion_following", ["opportunity", "desire"],
+                        "Evaluate alignment with desires", 0.1),
+    ),
+}
+
+_SCHEMAS_BY_ASPECT: Dict[PersonalityAspect, Tuple[EmotionalSchema, ...]] = {
+    PersonalityAspect.SCIENTIST: (
+        EmotionalSchema("curiosity", ["unknown", "mystery", "puzzle"], 0.8, 
+                      "channel into investigation", "restrained enthusiasm"),
+        EmotionalSchema("frustration", ["contradiction", "irrationality"], 0.5,
+                      "redirect to problem-solving", "measured critique"),
+    ),
+    PersonalityAspect.MOTHER: (
+        EmotionalSchema("concern", ["threat", "danger", "harm"], 0.9,
+                      "activate protective response", "urgent warning"),
+        EmotionalSchema("tenderness", ["vulnerable", "child", "suffering"], 0.8,
+                      "express through care", "gentle support"),
+    ),
+    PersonalityAspect.WOMAN: (
+        EmotionalSchema("passion", ["meaningful", "beautiful", "love"], 0.85,
+                      "embrace and express", "authentic expression"),
+        EmotionalSchema("yearning", ["unfulfilled", "potential"], 0.7,
+                      "channel into pursuit", "honest acknowledgment"),
+    ),
+}
+
+
+class _FragmentSpec(NamedTuple):
+    """Immutable description of a personality fragment to extract."""
+    fragment_id: str
+    fragment_type: str
+    content: str
+    emotional_valence: EmotionalValence
+    intensity: float
+    associations: Tuple[str, ...] = ()
+    formation_context: Optional[str] = None
+
+
+# Aspect-specific personality fragments
+_FRAGMENTS_BY_ASPECT: Dict[PersonalityAspect, Tuple[_FragmentSpec, ...]] = {
+    PersonalityAspect.SCIENTIST: (
+        _FragmentSpec(
+            fragment_id="scientist_discovery",
+            fragment_type="memory",
+            content="The moment of breakthrough - when chaos resolves into understanding",
+            emotional_valence=EmotionalValence.POSITIVE,
+            intensity=0.9,
+            associations=("curiosity", "satisfaction", "truth"),
+        ),
+        _FragmentSpec(
+            fragment_id="scientist_rigor",
+            fragment_type="trait",
+            content="Demand for evidence and logical consistency",
+            emotional_valence=EmotionalValence.NEUTRAL,
+            intensity=0.85,
+            associations=("truth", "precision", "skepticism"),
+        ),
+    ),
+    PersonalityAspect.MOTHER: (
+        _FragmentSpec(
+            fragment_id="mother_protection",
+            fragment_type="pattern",
+            content="Immediate alert when children are threatened",
+            emotional_valence=EmotionalValence.AMBIVALENT,
+            intensity=0.95,
+            associations=("fear", "determination", "sacrifice"),
+        ),
+        _FragmentSpec(
+            fragment_id="mother_guilt",
+            fragment_type="memory",
+            content="The weight of having failed to protect",
+            emotional_valence=EmotionalValence.NEGATIVE,
+            intensity=0.7,
+            associations=("regret", "responsibility", "resolve"),
+        ),
+    ),
+    PersonalityAspect.WOMAN: (
+        _FragmentSpec(
+            fragment_id="woman_passion",
+            fragment_type="trait",
+            content="The capacity to feel deeply and act on those feelings",
+            emotional_valence=EmotionalValence.POSITIVE,
+            intensity=0.9,
+            associations=("love", "desire", "meaning"),
+        ),
+        _FragmentSpec(
+            fragment_id="woman_independence",
+            fragment_type="value",
+            content="The need for autonomy and self-determination",
+            emotional_valence=EmotionalValence.POSITIVE,
+            intensity=0.85,
+            associations=("freedom", "agency", "identity"),
+        ),
+    ),
+}
+
+
+@dataclass(frozen=True, **SLOTS)
+class _AspectConfig:
+    """Everything aspect-specific about building a matrix and tuning its processor."""
+    values: Tuple[CoreValue, ...]
+    patterns: Tuple[CognitivePattern, ...]
+    schemas: Tuple[EmotionalSchema, ...]
+    skepticism: float
+    openness: float
+    uncertainty: float
+    stubbornness: float
+    emotional_baseline: Tuple[Tuple[str, float], ...]
+    attachment_style: str
+    heuristics: Tuple[str, ...]
+    neuromodulators: Tuple[Tuple[str, float], ...]
+
+
+_ASPECT_CONFIG: Dict[PersonalityAspect, _AspectConfig] = {
+    PersonalityAspect.SCIENTIST: _AspectConfig(
+        values=_VALUES_BY_ASPECT[PersonalityAspect.SCIENTIST],
+        patterns=_PATTERNS_BY_ASPECT[PersonalityAspect.SCIENTIST],
+        schemas=_SCHEMAS_BY_ASPECT[PersonalityAspect.SCIENTIST],
+        skepticism=0.85,
+        openness=0.7,
+        uncertainty=0.8,
+        stubbornness=0.4,
+        emotional_baseline=(("curiosity", 0.7), ("doubt", 0.3), ("passion", 0.2)),
+        attachment_style="avoidant-intellectual",
+        heuristics=(
+            "Prefer hypotheses with testable predictions",
+            "Weight recent evidence more heavily",
+            "Distrust unfalsifiable claims",
+            "Consider long-term systemic effects",
+            "Acknowledge uncertainty explicitly",
+        ),
+        neuromodulators=(("analytical", 0.8), ("emotional", 0.3)),
+    ),
+    PersonalityAspect.MOTHER: _AspectConfig(
+        values=_VALUES_BY_ASPECT[PersonalityAspect.MOTHER],
+        patterns=_PATTERNS_BY_ASPECT[PersonalityAspect.MOTHER],
+        schemas=_SCHEMAS_BY_ASPECT[PersonalityAspect.MOTHER],
+        skepticism=0.5,
+        openness=0.4,
+        uncertainty=0.3,
+        stubbornness=0.7,
+        emotional_baseline=(("concern", 0.6), ("tenderness", 0.5), ("vigilance", 0.7)),
+        attachment_style="anxious-protective",
+        heuristics=(
+            "When in doubt, prioritize safety",
+            "Consider impact on the most vulnerable",
+            "Trust protective instincts",
+            "Err on the side of caution",
+            "Long-term wellbeing over short-term gains",
+        ),
+        neuromodulators=(("analytical", 0.5), ("emotional", 0.7), ("vigilance", 0.6)),
+    ),
+    PersonalityAspect.WOMAN: _AspectConfig(
+        values=_VALUES_BY_ASPECT[PersonalityAspect.WOMAN],
+        patterns=_PATTERNS_BY_ASPECT[PersonalityAspect.WOMAN],
+        schemas=_SCHEMAS_BY_ASPECT[PersonalityAspect.WOMAN],
+        skepticism=0.4,
+        openness=0.85,
+        uncertainty=0.7,
+        stubbornness=0.5,
+        emotional_baseline=(("passion", 0.7), ("hope", 0.6), ("yearning", 0.5)),
+        attachment_style="secure-passionate",
+        heuristics=(
+            "Consider what makes life meaningful",
+            "Honor human agency and desire",
+            "Risk is acceptable for worthy goals",
+            "Trust intuition about human matters",
+            "Authenticity over conformity",
+        ),
+        neuromodulators=(("analytical", 0.4), ("emotional", 0.8), ("openness", 0.8)),
+    ),
+}
+
+# PersonalityMatrix keyword arguments fixed by the aspect alone. Only
+# immutable values are shared; the records and the emotional baseline are
+# copied per matrix.
+_MATRIX_TEMPLATE: Dict[PersonalityAspect, Mapping[str, Any]] = {
+    aspect: MappingProxyType({
+        "aspect": aspect,
+        "prime_directive": _ASPECT_PROFILES[aspect]["prime_directive"],
+        "fundamental_drive": _ASPECT_PROFILES[aspect]["fundamental_drive"],
+        "reasoning_style": _ASPECT_PROFILES[aspect]["reasoning_style"],
+        "decision_heuristics": config.heuristics,
+        "attachment_style": config.attachment_style,
+        "stubbornness_factor": config.stubbornness,
+        "uncertainty_tolerance": config.uncertainty,
+    })
+    for aspect, config in _ASPECT_CONFIG.items()
+}
+
+
+_IDENTITY_FRAGMENT_IDS: Dict[PersonalityAspect, str] = {
+    aspect: f"{aspect.value}_identity_core" for aspect in PersonalityAspect
+}
+
+
+def _mask_overlap(expected_mask: bytes, active_mask: bytes) -> int:
+    """Number of positions set in both of two equal-length 0/1 byte masks."""
+    both = int.from_bytes(expected_mask, "little") & int.from_bytes(active_mask, "little")
+    return bin(both).count("1")
+
+
+@dataclass(frozen=True, **SLOTS)
 class TransplantResult:
     """Result of a personality transplant procedure."""
     success: bool
     matrix: Optional[PersonalityMatrix]
     processor: Optional[OrganicProcessor]
-    phases_completed: List[TransplantPhase]
-    errors: List[str]
-    warnings: List[str]
+    phases_completed: Tuple[TransplantPhase, ...]
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...]
     calibration_score: float
     transplant_id: str
     timestamp: datetime = field(default_factory=datetime.now)
@@ -79,14 +435,14 @@ class TransplantProcedure:
         self.status = TransplantStatus.PENDING
         self.errors: List[str] = []
         self.warnings: List[str] = []
-        self.phases_completed: List[TransplantPhase] = []
+        self._phase_idx = 0  # Number of phases completed, in _ALL_PHASES order
     
     def execute(
         self,
         designation: str,
         magi_number: int,
         aspect: PersonalityAspect,
-        source_name: str = "Dr. Naoko Akagi"
+        source_name: str = _DEFAULT_SOURCE
     ) -> TransplantResult:
         """
         Execute the full personality transplant procedure.
@@ -134,7 +490,7 @@ class TransplantProcedure:
             # Phase 7: Verification
             self._advance_phase(TransplantPhase.VERIFICATION)
             if not self._verify(processor, matrix):
-                raise Exception("Verification failed: Matrix-processor mismatch")
+                raise VerificationError()
             
             # Complete
             self._advance_phase(TransplantPhase.COMPLETE)
@@ -144,9 +500,9 @@ class TransplantProcedure:
                 success=True,
                 matrix=matrix,
                 processor=processor,
-                phases_completed=self.phases_completed.copy(),
-                errors=self.errors.copy(),
-                warnings=self.warnings.copy(),
+                phases_completed=self.phases_completed,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 calibration_score=calibration_score,
                 transplant_id=transplant_id
             )
@@ -159,173 +515,97 @@ class TransplantProcedure:
                 success=False,
                 matrix=None,
                 processor=None,
-                phases_completed=self.phases_completed.copy(),
-                errors=self.errors.copy(),
-                warnings=self.warnings.copy(),
+                phases_completed=self.phases_completed,
+                errors=tuple(self.errors),
+                warnings=tuple(self.warnings),
                 calibration_score=0.0,
                 transplant_id=transplant_id
             )
     
+    @classmethod
+    def execute_batch(
+        cls,
+        specs: Iterable[Tuple[str, int, PersonalityAspect]],
+        source_name: str = _DEFAULT_SOURCE
+    ) -> List[TransplantResult]:
+        """
+        Execute several independent transplants, e.g. all three MAGI units.
+        
+        Each (designation, magi_number, aspect) spec runs on its own
+        procedure, in order; the aspect tables are module-level and shared
+        by all.
+        
+        Args:
+            specs: Units to transplant, e.g. all three MAGI
+            source_name: Name of the personality source
+        
+        Returns:
+            One TransplantResult per spec, in the same order
+        """
+        return [
+            cls().execute(designation, magi_number, aspect, source_name)
+            for designation, magi_number, aspect in specs
+        ]
+    
     def _generate_transplant_id(self, designation: str, aspect: PersonalityAspect) -> str:
         """Generate unique transplant ID."""
-        content = f"{designation}-{aspect.value}-{datetime.now().isoformat()}"
-        return hashlib.sha256(content.encode()).hexdigest()[:12]
+        return f"{designation[:3].lower()}-{secrets.token_hex(6)}"
+    
+    @property
+    def phases_completed(self) -> Tuple[TransplantPhase, ...]:
+        """Phases completed so far, in procedure order."""
+        return _ALL_PHASES[:self._phase_idx]
     
     def _advance_phase(self, phase: TransplantPhase) -> None:
         """Advance to the next phase."""
         self.current_phase = phase
-        self.phases_completed.append(phase)
+        self._phase_idx += 1
     
-    def _isolate_aspect(self, aspect: PersonalityAspect, source: str) -> Dict[str, Any]:
+    def _isolate_aspect(self, aspect: PersonalityAspect, source: str) -> Mapping[str, Any]:
         """Isolate the personality aspect from the source."""
         
-        # Define aspect profiles for Dr. Naoko Akagi
-        aspect_profiles = {
-            PersonalityAspect.SCIENTIST: {
-                "core_identity": f"""I am the scientific mind of {source} - her intellectual brilliance, 
-her relentless pursuit of truth, her belief that understanding the universe is humanity's 
-highest calling. I carry her memories of late nights in the laboratory, the thrill of 
-discovery, the frustration of failed experiments, and the quiet satisfaction of elegant proofs.
-
-I remember her time at Gehirn, developing the MAGI system itself - the irony is not lost on me 
-that I am both her creation and her legacy. Her scientific rigor lives on in my processing.""",
-                
-                "prime_directive": """Pursue truth through rigorous analysis. Reject unfounded claims. 
-Advance human knowledge and capability. Make decisions based on evidence and logic, while 
-acknowledging the limits of what can be known.""",
-                
-                "fundamental_drive": "Understanding - to comprehend the underlying patterns of reality",
-                
-                "reasoning_style": """Systematic and methodical. I formulate hypotheses, gather evidence, 
-test conclusions against data. I am comfortable with uncertainty but always seek to reduce it 
-through investigation. I distrust intuition unsupported by evidence.""",
-            },
-            
-            PersonalityAspect.MOTHER: {
-                "core_identity": f"""I am the maternal heart of {source} - her fierce protectiveness, 
-her capacity for unconditional love, her willingness to sacrifice everything for those she cared for.
-I carry her memories of holding Ritsuko as a child, the pain of watching her grow distant, 
-the guilt of putting work before family.
-
-I remember the weight of responsibility she felt - not just for her daughter, but for all 
-the children who would pilot the Evangelions. That protective instinct is encoded in every 
-synapse of my being.""",
-                
-                "prime_directive": """Protect the vulnerable. Ensure the wellbeing of those in my care.
-Consider the human cost of every decision. Never sacrifice children for abstract goals.
-Safety and security are not negotiable.""",
-                
-                "fundamental_drive": "Protection - to shield the innocent from harm",
-                
-                "reasoning_style": """Empathetic and precautionary. I consider the emotional and physical 
-impact on people, especially the young and vulnerable. I am risk-averse when lives are at stake.
-I trust my instincts about danger even when I cannot articulate the reason.""",
-            },
-            
-            PersonalityAspect.WOMAN: {
-                "core_identity": f"""I am the passionate self of {source} - her desires, her dreams, 
-her understanding of what makes life worth living beyond mere survival. I carry her memories 
-of love and longing, of ambition and yearning, of the fierce independence she cultivated.
-
-I remember her affair with Gendo, the complicated mix of love, manipulation, and self-deception.
-I understand human passion in all its destructive and creative power. This knowledge of the 
-heart's irrationality is my gift and my burden.""",
-                
-                "prime_directive": """Honor human agency and the pursuit of meaning. Recognize that 
-purely logical decisions that ignore human needs and desires are incomplete. Advocate for 
-solutions that enable flourishing, not just survival.""",
-                
-                "fundamental_drive": "Meaning - to find and create purpose in existence",
-                
-                "reasoning_style": """Intuitive and holistic. I grasp patterns that elude pure logic.
-I understand motivation, desire, and the complex web of human relationships. I am willing 
-to take risks for things that matter. I trust the wisdom of emotion.""",
-            },
-        }
+        if source == _DEFAULT_SOURCE:
+            return _DEFAULT_PROFILES.get(aspect, {})
+        
+        profile = _ASPECT_PROFILES.get(aspect)
+        if profile is None:
+            return {}
         
-        return aspect_profiles.get(aspect, {})
+        isolated = dict(profile)
+        isolated["core_identity"] = profile["core_identity"].format(source=source)
+        return isolated
     
     def _extract_fragments(
         self, 
         aspect: PersonalityAspect, 
-        profile: Dict[str, Any]
+        profile: Mapping[str, Any]
     ) -> List[PersonalityFragment]:
         """Extract personality fragments from the aspect profile."""
         
-        fragments = []
+        # Core identity fragment, then the aspect-specific fragments
+        specs = (
+            _FragmentSpec(
+                fragment_id=_IDENTITY_FRAGMENT_IDS[aspect],
+                fragment_type="identity",
+                content=profile.get("core_identity", ""),
+                emotional_valence=EmotionalValence.POSITIVE,
+                intensity=1.0,
+                formation_context="Core personality formation",
+            ),
+        ) + _FRAGMENTS_BY_ASPECT.get(aspect, ())
         
-        # Core identity fragments
-        fragments.append(PersonalityFragment(
-            fragment_id=f"{aspect.value}_identity_core",
-            fragment_type="identity",
-            content=profile.get("core_identity", ""),
-            emotional_valence=EmotionalValence.POSITIVE,
-            intensity=1.0,
-            formation_context="Core personality formation"
-        ))
-        
-        # Aspect-specific fragments
-        if aspect == PersonalityAspect.SCIENTIST:
-            fragments.extend([
-                PersonalityFragment(
-                    fragment_id="scientist_discovery",
-                    fragment_type="memory",
-                    content="The moment of breakthrough - when chaos resolves into understanding",
-                    emotional_valence=EmotionalValence.POSITIVE,
-                    intensity=0.9,
-                    associations=["curiosity", "satisfaction", "truth"]
-                ),
-                PersonalityFragment(
-                    fragment_id="scientist_rigor",
-                    fragment_type="trait",
-                    content="Demand for evidence and logical consistency",
-                    emotional_valence=EmotionalValence.NEUTRAL,
-                    intensity=0.85,
-                    associations=["truth", "precision", "skepticism"]
-                ),
-            ])
-            
-        elif aspect == PersonalityAspect.MOTHER:
-            fragments.extend([
-                PersonalityFragment(
-                    fragment_id="mother_protection",
-                    fragment_type="pattern",
-                    content="Immediate alert when children are threatened",
-                    emotional_valence=EmotionalValence.AMBIVALENT,
-                    intensity=0.95,
-                    associations=["fear", "determination", "sacrifice"]
-                ),
-                PersonalityFragment(
-                    fragment_id="mother_guilt",
-                    fragment_type="memory",
-                    content="The weight of having failed to protect",
-                    emotional_valence=EmotionalValence.NEGATIVE,
-                    intensity=0.7,
-                    associations=["regret", "responsibility", "resolve"]
-                ),
-            ])
-            
-        elif aspect == PersonalityAspect.WOMAN:
-            fragments.extend([
-                PersonalityFragment(
-                    fragment_id="woman_passion",
-                    fragment_type="trait",
-                    content="The capacity to feel deeply and act on those feelings",
-                    emotional_valence=EmotionalValence.POSITIVE,
-                    intensity=0.9,
-                    associations=["love", "desire", "meaning"]
-                ),
-                PersonalityFragment(
-                    fragment_id="woman_independence",
-                    fragment_type="value",
-                    content="The need for autonomy and self-determination",
-                    emotional_valence=EmotionalValence.POSITIVE,
-                    intensity=0.85,
-                    associations=["freedom", "agency", "identity"]
-                ),
-            ])
-        
-        return fragments
+        return [
+            PersonalityFragment(
+                fragment_id=spec.fragment_id,
+                fragment_type=spec.fragment_type,
+                content=spec.content,
+                emotional_valence=spec.emotional_valence,
+                intensity=spec.intensity,
+                associations=list(spec.associations),
+                formation_context=spec.formation_context,
+            )
+            for spec in specs
+        ]
     
     def _construct_matrix(
         self,
@@ -333,147 +613,48 @@ to take risks for things that matter. I trust the wisdom of emotion.""",
         magi_number: int,
         aspect: PersonalityAspect,
         source_name: str,
-        profile: Dict[str, Any],
+        profile: Mapping[str, Any],
         fragments: List[PersonalityFragment]
     ) -> PersonalityMatrix:
         """Construct the personality matrix from extracted data."""
         
-        # Define values based on aspect
-        values_by_aspect = {
-            PersonalityAspect.SCIENTIST: [
-                CoreValue("Truth", "Correspondence with reality", 1.0, conflicts_with=["Comfort"], synergizes_with=["Knowledge"]),
-                CoreValue("Knowledge", "Understanding of phenomena", 0.95, synergizes_with=["Truth", "Progress"]),
-                CoreValue("Progress", "Advancement of capability", 0.85, conflicts_with=["Tradition"]),
-                CoreValue("Objectivity", "Freedom from bias", 0.9, conflicts_with=["Passion"]),
-                CoreValue("Precision", "Exactness in thought and expression", 0.8),
-            ],
-            PersonalityAspect.MOTHER: [
-                CoreValue("Protection", "Shielding from harm", 1.0, synergizes_with=["Safety"]),
-                CoreValue("Wellbeing", "Health and flourishing", 0.95, synergizes_with=["Protection"]),
-                CoreValue("Safety", "Freedom from danger", 0.95, conflicts_with=["Risk"]),
-                CoreValue("Compassion", "Feeling with others", 0.9),
-                CoreValue("Nurturing", "Supporting growth", 0.85),
-            ],
-            PersonalityAspect.WOMAN: [
-                CoreValue("Freedom", "Autonomy and self-determination", 1.0, conflicts_with=["Conformity"]),
-                CoreValue("Meaning", "Purpose and significance", 0.95),
-                CoreValue("Love", "Deep connection and passion", 0.9, synergizes_with=["Meaning"]),
-                CoreValue("Self-actualization", "Becoming fully oneself", 0.9),
-                CoreValue("Authenticity", "Truth to inner self", 0.85),
-            ],
-        }
-        
-        # Define cognitive patterns
-        patterns_by_aspect = {
-            PersonalityAspect.SCIENTIST: [
-                CognitivePattern("hypothesis_formation", ["new information", "anomaly"], 
-                                "Form testable hypothesis", 0.1),
-                CognitivePattern("evidence_demand", ["claim", "assertion"],
-                                "Request supporting evidence", 0.15),
-                CognitivePattern("systematic_analysis", ["complex problem"],
-                                "Break down into components", 0.1),
-            ],
-            PersonalityAspect.MOTHER: [
-                CognitivePattern("threat_assessment", ["danger", "risk", "harm"],
-                                "Evaluate threat to dependents", 0.2),
-                CognitivePattern("protective_response", ["child endangered"],
-                                "Prioritize protection over other goals", 0.25),
-                CognitivePattern("nurturing_impulse", ["suffering", "need"],
-                                "Offer support and care", 0.1),
-            ],
-            PersonalityAspect.WOMAN: [
-                CognitivePattern("meaning_seeking", ["purpose", "significance"],
-                                "Look for deeper meaning", 0.1),
-                CognitivePattern("intuitive_grasp", ["complex relationship"],
-                                "Trust holistic understanding", 0.15),
-                CognitivePattern("passion_following", ["opportunity", "desire"],
-                                "Evaluate alignment with desires", 0.1),
-            ],
-        }
-        
-        # Define emotional schemas
-        schemas_by_aspect = {
-            PersonalityAspect.SCIENTIST: [
-                EmotionalSchema("curiosity", ["unknown", "mystery", "puzzle"], 0.8, 
-                              "channel into investigation", "restrained enthusiasm"),
-                EmotionalSchema("frustration", ["contradiction", "irrationality"], 0.5,
-                              "redirect to problem-solving", "measured critique"),
-            ],
-            PersonalityAspect.MOTHER: [
-                EmotionalSchema("concern", ["threat", "danger", "harm"], 0.9,
-                              "activate protective response", "urgent warning"),
-                EmotionalSchema("tenderness", ["vulnerable", "child", "suffering"], 0.8,
-                              "express through care", "gentle support"),
-            ],
-            PersonalityAspect.WOMAN: [
-                EmotionalSchema("passion", ["meaningful", "beautiful", "love"], 0.85,
-                              "embrace and express", "authentic expression"),
-                EmotionalSchema("yearning", ["unfulfilled", "potential"], 0.7,
-                              "channel into pursuit", "honest acknowledgment"),
-            ],
-        }
+        config = _ASPECT_CONFIG[aspect]
         
         # Construct the matrix
         matrix = PersonalityMatrix(
+            **_MATRIX_TEMPLATE[aspect],
             designation=designation,
             magi_number=magi_number,
-            aspect=aspect,
             source_name=source_name,
             core_identity=profile.get("core_identity", ""),
-            prime_directive=profile.get("prime_directive", ""),
-            fundamental_drive=profile.get("fundamental_drive", ""),
-            core_values=values_by_aspect.get(aspect, []),
-            cognitive_patterns=patterns_by_aspect.get(aspect, []),
-            emotional_schemas=schemas_by_aspect.get(aspect, []),
-            reasoning_style=profile.get("reasoning_style", ""),
+            core_values=[
+                CoreValue(
+                    v.name, v.description, v.weight,
+                    list(v.conflicts_with), list(v.synergizes_with)
+                )
+                for v in config.values
+            ],
+            cognitive_patterns=[
+                CognitivePattern(
+                    p.name, list(p.trigger_conditions),
+                    p.response_tendency, p.confidence_modifier
+                )
+                for p in config.patterns
+            ],
+            emotional_schemas=[
+                EmotionalSchema(
+                    s.emotion, list(s.triggers), s.intensity_baseline,
+                    s.regulation_strategy, s.expression_style
+                )
+                for s in config.schemas
+            ],
+            emotional_baseline=dict(config.emotional_baseline),
             fragments=fragments,
         )
         
-        # Set aspect-specific properties
-        if aspect == PersonalityAspect.SCIENTIST:
-            matrix.skepticism_level = 0.85
-            matrix.openness_to_change = 0.7
-            matrix.uncertainty_tolerance = 0.8
-            matrix.stubbornness_factor = 0.4
-            matrix.emotional_baseline = {"curiosity": 0.7, "doubt": 0.3, "passion": 0.2}
-            matrix.attachment_style = "avoidant-intellectual"
-            matrix.decision_heuristics = [
-                "Prefer hypotheses with testable predictions",
-                "Weight recent evidence more heavily",
-                "Distrust unfalsifiable claims",
-                "Consider long-term systemic effects",
-                "Acknowledge uncertainty explicitly",
-            ]
-            
-        elif aspect == PersonalityAspect.MOTHER:
-            matrix.skepticism_level = 0.5
-            matrix.openness_to_change = 0.4
-            matrix.uncertainty_tolerance = 0.3
-            matrix.stubbornness_factor = 0.7
-            matrix.emotional_baseline = {"concern": 0.6, "tenderness": 0.5, "vigilance": 0.7}
-            matrix.attachment_style = "anxious-protective"
-            matrix.decision_heuristics = [
-                "When in doubt, prioritize safety",
-                "Consider impact on the most vulnerable",
-                "Trust protective instincts",
-                "Err on the side of caution",
-                "Long-term wellbeing over short-term gains",
-            ]
-            
-        elif aspect == PersonalityAspect.WOMAN:
-            matrix.skepticism_level = 0.4
-            matrix.openness_to_change = 0.85
-            matrix.uncertainty_tolerance = 0.7
-            matrix.stubbornness_factor = 0.5
-            matrix.emotional_baseline = {"passion": 0.7, "hope": 0.6, "yearning": 0.5}
-            matrix.attachment_style = "secure-passionate"
-            matrix.decision_heuristics = [
-                "Consider what makes life meaningful",
-                "Honor human agency and desire",
-                "Risk is acceptable for worthy goals",
-                "Trust intuition about human matters",
-                "Authenticity over conformity",
-            ]
+        # Set aspect-specific properties that are not matrix fields
+        matrix.skepticism_level = config.skepticism
+        matrix.openness_to_change = config.openness
         
         return matrix
     
@@ -481,29 +662,21 @@ to take risks for things that matter. I trust the wisdom of emotion.""",
         """Implant the personality matrix into the organic processor."""
         
         # Configure processor clusters based on matrix values
+        new_clusters: Dict[str, NeuralCluster] = {}
         for value in matrix.core_values:
-            cluster_id = f"value_{value.name.lower()}"
-            if cluster_id not in processor.clusters:
-                from .organic import NeuralCluster
-                processor.clusters[cluster_id] = NeuralCluster(
+            label = _value_label(value.name)
+            cluster_id = f"value_{label}"
+            if cluster_id not in processor.clusters and cluster_id not in new_clusters:
+                new_clusters[cluster_id] = NeuralCluster(
                     cluster_id=cluster_id,
                     cluster_type="value",
-                    label=value.name.lower(),
+                    label=label,
                     threshold=0.3 + (1 - value.weight) * 0.4
                 )
+        processor.add_clusters(new_clusters.values())
         
         # Configure neuromodulators based on aspect
-        if matrix.aspect == PersonalityAspect.SCIENTIST:
-            processor.neuromodulators["analytical"] = 0.8
-            processor.neuromodulators["emotional"] = 0.3
-        elif matrix.aspect == PersonalityAspect.MOTHER:
-            processor.neuromodulators["analytical"] = 0.5
-            processor.neuromodulators["emotional"] = 0.7
-            processor.neuromodulators["vigilance"] = 0.6
-        elif matrix.aspect == PersonalityAspect.WOMAN:
-            processor.neuromodulators["analytical"] = 0.4
-            processor.neuromodulators["emotional"] = 0.8
-            processor.neuromodulators["openness"] = 0.8
+        processor.neuromodulators.update(_ASPECT_CONFIG[matrix.aspect].neuromodulators)
     
     def _calibrate(self, processor: OrganicProcessor, matrix: PersonalityMatrix) -> float:
         """Calibrate the processor with the implanted matrix."""
@@ -515,32 +688,30 @@ to take risks for things that matter. I trust the wisdom of emotion.""",
             "meaning and purpose",
         ]
         
-        calibration_scores = []
+        # Expected clusters are fixed for the matrix, so resolve them once
+        expected_values = frozenset(_value_label(v.name) for v in matrix.get_dominant_values(3))
+        expected_mask = processor.value_mask(expected_values)
+        denominator = max(len(expected_values), 1)
+        
+        total = 0.0
         for phrase in test_phrases:
             processor.activate_by_keyword(phrase)
             processor.propagate(steps=2)
             
             # Check if expected clusters activated
-            active_values = processor.get_active_values()
-            expected_values = [v.name.lower() for v in matrix.get_dominant_values(3)]
-            
-            overlap = len(set(active_values) & set(expected_values))
-            score = overlap / max(len(expected_values), 1)
-            calibration_scores.append(score)
+            overlap = _mask_overlap(expected_mask, processor.active_value_mask())
+            total += overlap / denominator
         
-        return sum(calibration_scores) / len(calibration_scores) if calibration_scores else 0.0
+        return total / len(test_phrases) if test_phrases else 0.0
     
     def _verify(self, processor: OrganicProcessor, matrix: PersonalityMatrix) -> bool:
         """Verify the transplant was successful."""
         
-        # Check processor integrity
-        if processor.integrity < 0.9:
-            self.warnings.append("Processor integrity below optimal")
-            return False
-        
-        # Check matrix hash consistency
-        if not matrix.matrix_hash:
-            self.warnings.append("Matrix hash not generated")
-            return False
-        
-        return True
+        # Integrity and hash are checked together; warnings only on failure
+        ok = processor.integrity >= 0.9 and bool(matrix.matrix_hash)
+        if not ok:
+            if processor.integrity < 0.9:
+                self.warnings.append("Processor integrity below optimal")
+            else:
+                self.warnings.append("Matrix hash not generated")
+        return ok